@@ -1,7 +1,10 @@
 """Telegram bot handler."""
 
+import asyncio
 import logging
 import os
+from heapq import merge
+from operator import itemgetter
 from typing import Optional
 
 from telegram import Update
@@ -14,11 +17,31 @@ from telegram.ext import (
 )
 
 from .character import Character
-from .llm import LLMClient
-from .memory import MemoryManager
+from .llm import stream_reply, trim_history
+from .memory import is_searchable_query
+from .services import Services
 
 logger = logging.getLogger(__name__)
 
+# Text shown until the first part of a streamed response arrives
+STREAMING_PLACEHOLDER = "…"
+
+# Seconds to wait on shutdown for background tasks such as fact extraction
+BACKGROUND_TASK_TIMEOUT = 10.0
+
+# Shown when a message could not be answered
+ERROR_RESPONSE_TEXT = "Sorry, I had trouble processing that. Could you try again?"
+
+# Static command replies
+NO_FACTS_TEXT = (
+    "I haven't learned any specific facts about you yet. "
+    "We'll get to know each other as we chat!"
+)
+FORGET_TEXT = (
+    "Memory clearing is not implemented yet. "
+    "If you need to reset, you can delete the Qdrant data volume."
+)
+
 
 class ChattyBot:
     """Telegram bot that uses LLM for conversations with memory."""
@@ -28,8 +51,9 @@ class ChattyBot:
         token: str,
         allowed_user_id: int,
         character: Character,
-        llm: LLMClient,
-        memory: MemoryManager,
+        services: Services,
+        webhook_url: Optional[str] = None,
+        webhook_port: int = 8443,
     ):
         """
         Initialize the bot.
@@ -38,75 +62,65 @@ class ChattyBot:
             token: Telegram bot token
             allowed_user_id: Only respond to this user ID
             character: Character configuration
-            llm: LLM client for generating responses
-            memory: Memory manager for storing/retrieving context
+            services: Shared LLM, memory and embedding services
+            webhook_url: Public base URL for webhook mode (None to use polling)
+            webhook_port: Local port the webhook server listens on
         """
         self.token = token
         self.allowed_user_id = allowed_user_id
         self.character = character
-        self.llm = llm
-        self.memory = memory
+        self.llm = services.llm
+        self.memory = services.memory
+        self.embedder = services.embedder
+        self.webhook_url = webhook_url
+        self.webhook_port = webhook_port
+
+        # Command replies that only depend on the character
+        self._start_text = (
+            f"Hey! I'm {character.name}. Nice to meet you! "
+            f"Feel free to chat with me anytime. 💬"
+        )
+        self._help_text = (
+            f"I'm {character.name}, your AI companion!\n\n"
+            "Just send me a message and I'll respond. "
+            "I remember our conversations and learn about you over time.\n\n"
+            "Commands:\n"
+            "/start - Start a conversation\n"
+            "/help - Show this help message\n"
+            "/facts - See what I remember about you\n"
+            "/forget - Clear my memory of our conversations"
+        )
 
         # Store application reference for sending proactive messages
         self.application: Optional[Application] = None
 
-    def _is_allowed_user(self, user_id: int) -> bool:
-        """Check if the user is allowed to interact with the bot."""
-        return user_id == self.allowed_user_id
+        # Fire-and-forget tasks (e.g. fact extraction) still in flight
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Per-chat message queues and the worker tasks draining them
+        self._chat_queues: dict[int, asyncio.Queue] = {}
+        self._chat_workers: dict[int, asyncio.Task] = {}
 
     async def start_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /start command."""
-        if not update.effective_user or not self._is_allowed_user(
-            update.effective_user.id
-        ):
-            logger.info(
-                f"Ignoring /start from unauthorized user: {update.effective_user.id if update.effective_user else 'unknown'}"
-            )
-            return
-
-        await update.message.reply_text(
-            f"Hey! I'm {self.character.name}. Nice to meet you! "
-            f"Feel free to chat with me anytime. 💬"
-        )
+        await update.message.reply_text(self._start_text)
 
     async def help_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /help command."""
-        if not update.effective_user or not self._is_allowed_user(
-            update.effective_user.id
-        ):
-            return
-
-        await update.message.reply_text(
-            f"I'm {self.character.name}, your AI companion!\n\n"
-            "Just send me a message and I'll respond. "
-            "I remember our conversations and learn about you over time.\n\n"
-            "Commands:\n"
-            "/start - Start a conversation\n"
-            "/help - Show this help message\n"
-            "/facts - See what I remember about you\n"
-            "/forget - Clear my memory of our conversations"
-        )
+        await update.message.reply_text(self._help_text)
 
     async def facts_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /facts command - show stored facts about user."""
-        if not update.effective_user or not self._is_allowed_user(
-            update.effective_user.id
-        ):
-            return
-
-        facts = self.memory.get_all_facts()
+        facts = await self.memory.get_all_facts()
 
         if not facts:
-            await update.message.reply_text(
-                "I haven't learned any specific facts about you yet. "
-                "We'll get to know each other as we chat!"
-            )
+            await update.message.reply_text(NO_FACTS_TEXT)
         else:
             facts_text = "\n".join(f"• {fact}" for fact in facts)
             await update.message.reply_text(
@@ -117,101 +131,166 @@ class ChattyBot:
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /forget command - placeholder for clearing memory."""
-        if not update.effective_user or not self._is_allowed_user(
-            update.effective_user.id
-        ):
-            return
-
-        await update.message.reply_text(
-            "Memory clearing is not implemented yet. "
-            "If you need to reset, you can delete the Qdrant data volume."
-        )
+        await update.message.reply_text(FORGET_TEXT)
 
     async def handle_message(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle incoming text messages."""
-        if not update.effective_user or not update.message or not update.message.text:
-            return
-
-        user_id = update.effective_user.id
-
-        # Ignore messages from unauthorized users
-        if not self._is_allowed_user(user_id):
-            logger.info(f"Ignoring message from unauthorized user: {user_id}")
+        if not update.message or not update.message.text:
             return
 
+        # Queue the message for its chat so this handler returns immediately
+        # while messages within a chat are still answered in order
+        chat_id = update.effective_chat.id
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = asyncio.Queue()
+            self._chat_workers[chat_id] = asyncio.create_task(self._chat_worker(queue))
+        queue.put_nowait((update, context))
+
+    async def _chat_worker(self, queue: asyncio.Queue) -> None:
+        """Process queued messages of a single chat one at a time."""
+        while True:
+            update, context = await queue.get()
+            try:
+                await self._process_message(update, context)
+            except Exception as e:
+                logger.error(f"Error processing queued message: {e}", exc_info=True)
+            finally:
+                queue.task_done()
+
+    async def _process_message(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        """Generate and send a response to a text message."""
         user_message = update.message.text
-        logger.info(f"Received message from user {user_id}: {user_message[:50]}...")
+        logger.info(
+            f"Received message from user {update.effective_user.id}: {user_message[:50]}..."
+        )
 
         # Show typing indicator
         await context.bot.send_chat_action(
             chat_id=update.effective_chat.id, action="typing"
         )
 
+        # Set once the placeholder is sent and once the reply is complete
+        sent = None
+        response = None
+
         try:
-            # Get relevant context from memory
-            relevant_history = self.memory.get_relevant_history(user_message, limit=5)
-            recent_history = self.memory.get_recent_history(limit=10)
-            relevant_facts = self.memory.get_relevant_facts(user_message, limit=5)
-
-            # Combine histories, preferring recent but including relevant
-            history_ids = set()
-            combined_history = []
-
-            for msg in recent_history:
-                msg_key = f"{msg['role']}:{msg['timestamp']}"
-                if msg_key not in history_ids:
-                    history_ids.add(msg_key)
-                    combined_history.append(msg)
-
-            for msg in relevant_history:
-                msg_key = f"{msg['role']}:{msg['timestamp']}"
-                if msg_key not in history_ids:
-                    history_ids.add(msg_key)
-                    combined_history.append(msg)
-
-            # Sort by timestamp
-            combined_history.sort(key=lambda m: m["timestamp"])
-
-            # Build system prompt with facts
+            # Embed the message once (while fetching recent history) and reuse
+            # the vector for both similarity searches
+            query_vector, recent_history = await asyncio.gather(
+                self.embedder.embed(user_message),
+                self.memory.get_recent_history(limit=10),
+            )
+            # Short messages carry too little meaning for a similarity search
+            searchable = is_searchable_query(user_message)
+            if searchable:
+                relevant_history, relevant_facts = (
+                    await self.memory.get_relevant_context_by_vector(query_vector)
+                )
+            else:
+                relevant_history, relevant_facts = [], []
+
+            # Merge histories (both are sorted by timestamp) and drop duplicates,
+            # preferring recent but including relevant
+            combined_history = list(
+                {
+                    (msg["role"], msg["timestamp"]): msg
+                    for msg in merge(
+                        recent_history, relevant_history, key=itemgetter("timestamp")
+                    )
+                }.values()
+            )
+
+            # Keep the prompt within the history token budget, newest first
+            combined_history = trim_history(combined_history)
+
+            # The system prompt stays identical across turns (so the model server
+            # can reuse its cached prefix); date and facts go in a separate message
             system_prompt = self.character.get_system_prompt()
+            context_prompt = self.character.get_context_prompt()
             if relevant_facts:
-                facts_text = "\n".join(f"- {f}" for f in relevant_facts)
-                system_prompt += f"\n\n## What you know about the user:\n{facts_text}"
-
-            # Generate response
-            response = self.llm.generate_response(
+                facts_text = "- " + "\n- ".join(relevant_facts)
+                context_prompt += f"\n\n## What you know about the user:\n{facts_text}"
+
+            # Extract and store new facts in the background while the response
+            # is generated (don't wait for this)
+            self._run_in_background(self._extract_and_store_facts(user_message))
+
+            # Send a placeholder and fill it in as the response streams in
+            sent = await update.message.reply_text(STREAMING_PLACEHOLDER)
+            response = await stream_reply(
+                self.llm,
+                sent.edit_text,
                 system_prompt=system_prompt,
                 messages=combined_history,
                 user_message=user_message,
+                # Short messages like "ok" mean something different in every
+                # conversation, so they never go through the response cache
+                query_embedding=query_vector if searchable else None,
+                context=context_prompt,
+                use_cache=searchable,
             )
+            logger.info(f"Sent response: {response[:50]}...")
 
             # Store the conversation
-            self.memory.add_message("user", user_message)
-            self.memory.add_message("assistant", response)
-
-            # Extract and store new facts (don't wait for this)
-            self._extract_and_store_facts(user_message)
-
-            # Send response
-            await update.message.reply_text(response)
-            logger.info(f"Sent response: {response[:50]}...")
+            await self.memory.add_message("user", user_message, embedding=query_vector)
+            if response:
+                await self.memory.add_message("assistant", response)
 
         except Exception as e:
             logger.error(f"Error handling message: {e}", exc_info=True)
-            await update.message.reply_text(
-                "Sorry, I had trouble processing that. Could you try again?"
+            if sent is None:
+                await update.message.reply_text(ERROR_RESPONSE_TEXT)
+            elif response is None:
+                # Replace the placeholder or partial reply instead of leaving
+                # it behind; a complete reply stays as it is
+                await sent.edit_text(ERROR_RESPONSE_TEXT)
+
+    async def close(self) -> None:
+        """Stop the chat workers and wait for background tasks to finish."""
+        for worker in self._chat_workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._chat_workers.values(), return_exceptions=True)
+
+        # Let in-flight background work (e.g. fact extraction) finish so its
+        # writes reach memory before it is closed
+        if self._background_tasks:
+            _, pending = await asyncio.wait(
+                self._background_tasks, timeout=BACKGROUND_TASK_TIMEOUT
             )
-
-    def _extract_and_store_facts(self, user_message: str) -> None:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _run_in_background(self, coro) -> None:
+        """Run a coroutine as a task without awaiting it."""
+        task = asyncio.create_task(coro)
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _extract_and_store_facts(self, user_message: str) -> None:
         """Extract facts from user message and store them."""
         try:
-            existing_facts = self.memory.get_all_facts()
-            new_facts = self.llm.extract_facts(user_message, existing_facts)
-
+            # Served from the memory manager's in-process facts cache
+            existing_facts_text = await self.memory.get_facts_text()
+            new_facts = await self.llm.extract_facts(user_message, existing_facts_text)
+
+            known_facts = set(await self.memory.get_all_facts())
+            new_facts = [
+                fact for fact in dict.fromkeys(new_facts) if fact not in known_facts
+            ]
+            if not new_facts:
+                return
+
+            # Embed all new facts in one call and store them in one upsert
+            embeddings = await self.llm.embed_batch(new_facts)
+            await self.memory.add_facts(new_facts, embeddings)
             for fact in new_facts:
-                self.memory.add_fact(fact)
                 logger.info(f"Stored new fact: {fact}")
 
         except Exception as e:
@@ -238,7 +317,7 @@ class ChattyBot:
             )
 
             # Store the proactive message in memory
-            self.memory.add_message("assistant", message)
+            await self.memory.add_message("assistant", message)
 
             logger.info(f"Sent proactive message: {message[:50]}...")
             return True
@@ -274,24 +353,44 @@ class ChattyBot:
 
     def create_application(self) -> Application:
         """Create and configure the Telegram application."""
-        self.application = Application.builder().token(self.token).build()
+        # Updates are dispatched concurrently; per-chat ordering is kept by
+        # the message queues in handle_message
+        self.application = (
+            Application.builder().token(self.token).concurrent_updates(True).build()
+        )
+
+        # Only the allowed user's updates reach the handlers
+        allowed_user = filters.User(user_id=self.allowed_user_id)
 
         # Add handlers
-        self.application.add_handler(CommandHandler("start", self.start_command))
-        self.application.add_handler(CommandHandler("help", self.help_command))
-        self.application.add_handler(CommandHandler("facts", self.facts_command))
-        self.application.add_handler(CommandHandler("forget", self.forget_command))
         self.application.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message)
+            CommandHandler("start", self.start_command, filters=allowed_user)
+        )
+        self.application.add_handler(
+            CommandHandler("help", self.help_command, filters=allowed_user)
+        )
+        self.application.add_handler(
+            CommandHandler("facts", self.facts_command, filters=allowed_user)
+        )
+        self.application.add_handler(
+            CommandHandler("forget", self.forget_command, filters=allowed_user)
+        )
+        self.application.add_handler(
+            MessageHandler(
+                filters.TEXT & ~filters.COMMAND & allowed_user, self.handle_message
+            )
         )
 
         return self.application
 
 
-def create_bot() -> ChattyBot:
-    """Create a ChattyBot instance from environment variables."""
+def create_bot(services: Services) -> ChattyBot:
+    """Create a ChattyBot instance from environment variables.
+
+    Args:
+        services: Shared LLM, memory and embedding services
+    """
     from .character import load_character
-    from .tools import create_default_registry
 
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     if not token:
@@ -306,22 +405,24 @@ def create_bot() -> ChattyBot:
     except ValueError:
         raise ValueError(f"TELEGRAM_USER_ID must be an integer, got: {user_id_str}")
 
-    # Load character
-    character = load_character()
-
-    # Create tool registry with default tools (calendar, reminders)
-    tool_registry = create_default_registry()
-
-    # Create LLM client with tools
-    llm = LLMClient(tool_registry=tool_registry)
+    # Receive updates via webhook instead of long polling when configured
+    webhook_url = os.getenv("TELEGRAM_WEBHOOK_URL") or None
+    webhook_port_str = os.getenv("TELEGRAM_WEBHOOK_PORT", "8443")
+    try:
+        webhook_port = int(webhook_port_str)
+    except ValueError:
+        raise ValueError(
+            f"TELEGRAM_WEBHOOK_PORT must be an integer, got: {webhook_port_str}"
+        )
 
-    # Create memory manager with embedding function
-    memory = MemoryManager(embed_func=llm.embed)
+    # Load character (per bot, since each platform sets its own user name)
+    character = load_character()
 
     return ChattyBot(
         token=token,
         allowed_user_id=allowed_user_id,
         character=character,
-        llm=llm,
-        memory=memory,
+        services=services,
+        webhook_url=webhook_url,
+        webhook_port=webhook_port,
     )
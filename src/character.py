@@ -6,10 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import yaml
 
-
-@dataclass
+@dataclass(slots=True)
 class Character:
     """Represents the AI character configuration."""
 
@@ -20,13 +18,17 @@ class Character:
     proactive_prompts: dict[str, str] = field(default_factory=dict)
     user_name: Optional[str] = None
 
-    def get_system_prompt(self) -> str:
-        """Generate the system prompt from character configuration."""
-        # Get current date and time in local timezone
-        now = datetime.now()
-        current_datetime = now.strftime("%A, %B %d, %Y at %H:%M")
-        date_context = f"\n\n## Current Date and Time\nIt is currently {current_datetime}. Use this to interpret relative dates like 'today', 'tomorrow', 'next week', etc."
+    # Cached system prompt; it must stay byte-identical between messages so
+    # the model server can reuse its cached prefix
+    _system_prompt: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _prompt_user_name: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
+    def _build_system_prompt(self) -> str:
+        """Build the static system prompt."""
         user_context = ""
         if self.user_name:
             user_context = f"\n\n## User\nYou are talking to {self.user_name}. Address them by name when appropriate."
@@ -40,7 +42,7 @@ You have access to tools that let you check the user's calendar and reminders. U
 - You want to proactively reference something relevant from their calendar
 Only use tools when genuinely helpful. Don't force tool usage into every response."""
 
-        return f"""You are {self.name}, an AI companion with the following characteristics:{date_context}
+        return f"""You are {self.name}, an AI companion with the following characteristics:
 
 ## Personality
 {self.personality.strip()}
@@ -55,6 +57,32 @@ Remember: You are {self.name}. Stay in character. Be genuine, not performative.
 Write short messages, you are writing with an instant message app. No emdashes.
 Your responses should feel natural and true to your personality."""
 
+    def get_system_prompt(self) -> str:
+        """
+        Generate the system prompt from character configuration.
+
+        The prompt contains no per-message data, so it is identical across
+        calls until the user name changes. Send per-message data (such as
+        get_context_prompt) in a separate message to keep it that way.
+        """
+        # Rebuild only when missing or the user changed
+        if self._system_prompt is None or self._prompt_user_name != self.user_name:
+            self._system_prompt = self._build_system_prompt()
+            self._prompt_user_name = self.user_name
+
+        return self._system_prompt
+
+    def get_context_prompt(self) -> str:
+        """Generate the per-message context (current date and time)."""
+        # Get current date and time in local timezone
+        current_datetime = datetime.now().strftime("%A, %B %d, %Y at %H:%M")
+
+        return (
+            "## Current Date and Time\n"
+            f"It is currently {current_datetime}. Use this to interpret relative "
+            "dates like 'today', 'tomorrow', 'next week', etc."
+        )
+
     def get_proactive_prompt(self, prompt_type: str = "check_in") -> Optional[str]:
         """Get a proactive message prompt by type."""
         return self.proactive_prompts.get(prompt_type)
@@ -62,6 +90,11 @@ Your responses should feel natural and true to your personality."""
 
 def load_character(config_path: Optional[str] = None) -> Character:
     """Load character configuration from YAML file."""
+    import yaml
+
+    # Prefer the libyaml C parser when PyYAML was built with it
+    SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     if config_path is None:
         # Check env var first, then common locations
         config_path = os.getenv("CHARACTER_CONFIG")
@@ -85,8 +118,7 @@ def load_character(config_path: Optional[str] = None) -> Character:
     if not path.exists():
         raise FileNotFoundError(f"Character config not found: {config_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    config = yaml.load(path.read_text(encoding="utf-8"), Loader=SafeLoader)
 
     return Character(
         name=config.get("name", "Assistant"),
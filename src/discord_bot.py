@@ -1,18 +1,42 @@
 """Discord bot handler."""
 
+import asyncio
 import logging
 import os
+from heapq import merge
+from operator import itemgetter
 from typing import Optional
 
 import discord
 from discord import app_commands
 
 from .character import Character
-from .llm import LLMClient
-from .memory import MemoryManager
+from .llm import stream_reply, trim_history
+from .memory import is_searchable_query
+from .services import Services
 
 logger = logging.getLogger(__name__)
 
+# Text shown until the first part of a streamed response arrives
+STREAMING_PLACEHOLDER = "…"
+
+# Seconds to wait on shutdown for background tasks such as fact extraction
+BACKGROUND_TASK_TIMEOUT = 10.0
+
+# Shown when a message could not be answered
+ERROR_RESPONSE_TEXT = "Sorry, I had trouble processing that. Could you try again?"
+
+# Static command replies
+NOT_AUTHORIZED_TEXT = "You are not authorized to use this bot."
+NO_FACTS_TEXT = (
+    "I haven't learned any specific facts about you yet. "
+    "We'll get to know each other as we chat!"
+)
+FORGET_TEXT = (
+    "Memory clearing is not implemented yet. "
+    "If you need to reset, you can delete the Qdrant data volume."
+)
+
 
 class DiscordBot:
     """Discord bot that uses LLM for conversations with memory."""
@@ -22,8 +46,7 @@ class DiscordBot:
         token: str,
         allowed_user_id: int,
         character: Character,
-        llm: LLMClient,
-        memory: MemoryManager,
+        services: Services,
     ):
         """
         Initialize the bot.
@@ -32,14 +55,25 @@ class DiscordBot:
             token: Discord bot token
             allowed_user_id: Only respond to this user ID
             character: Character configuration
-            llm: LLM client for generating responses
-            memory: Memory manager for storing/retrieving context
+            services: Shared LLM, memory and embedding services
         """
         self.token = token
         self.allowed_user_id = allowed_user_id
         self.character = character
-        self.llm = llm
-        self.memory = memory
+        self.llm = services.llm
+        self.memory = services.memory
+        self.embedder = services.embedder
+
+        # Help reply only depends on the character, so build it once
+        self._help_text = (
+            f"I'm {character.name}, your AI companion!\n\n"
+            "Just send me a DM and I'll respond. "
+            "I remember our conversations and learn about you over time.\n\n"
+            "**Commands:**\n"
+            "`/help` - Show this help message\n"
+            "`/facts` - See what I remember about you\n"
+            "`/forget` - Clear my memory of our conversations"
+        )
 
         # Discord client setup
         intents = discord.Intents.default()
@@ -52,6 +86,13 @@ class DiscordBot:
         # Cache the user object for proactive messaging
         self._allowed_user: Optional[discord.User] = None
 
+        # Fire-and-forget tasks (e.g. fact extraction) still in flight
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Per-channel message queues and the worker tasks draining them
+        self._chat_queues: dict[int, asyncio.Queue] = {}
+        self._chat_workers: dict[int, asyncio.Task] = {}
+
         # Set up event handlers
         self._setup_handlers()
 
@@ -100,42 +141,39 @@ class DiscordBot:
             if not message.content:
                 return
 
-            await self._handle_message(message)
+            # Queue the message for its channel so the gateway keeps processing
+            # events while messages within a channel are answered in order
+            queue = self._chat_queues.get(message.channel.id)
+            if queue is None:
+                queue = self._chat_queues[message.channel.id] = asyncio.Queue()
+                self._chat_workers[message.channel.id] = asyncio.create_task(
+                    self._chat_worker(queue)
+                )
+            queue.put_nowait(message)
 
         # Slash commands
         @self.tree.command(name="help", description="Show help message")
         async def help_command(interaction: discord.Interaction):
             if not self._is_allowed_user(interaction.user.id):
                 await interaction.response.send_message(
-                    "You are not authorized to use this bot.", ephemeral=True
+                    NOT_AUTHORIZED_TEXT, ephemeral=True
                 )
                 return
 
-            await interaction.response.send_message(
-                f"I'm {self.character.name}, your AI companion!\n\n"
-                "Just send me a DM and I'll respond. "
-                "I remember our conversations and learn about you over time.\n\n"
-                "**Commands:**\n"
-                "`/help` - Show this help message\n"
-                "`/facts` - See what I remember about you\n"
-                "`/forget` - Clear my memory of our conversations"
-            )
+            await interaction.response.send_message(self._help_text)
 
         @self.tree.command(name="facts", description="See what I remember about you")
         async def facts_command(interaction: discord.Interaction):
             if not self._is_allowed_user(interaction.user.id):
                 await interaction.response.send_message(
-                    "You are not authorized to use this bot.", ephemeral=True
+                    NOT_AUTHORIZED_TEXT, ephemeral=True
                 )
                 return
 
-            facts = self.memory.get_all_facts()
+            facts = await self.memory.get_all_facts()
 
             if not facts:
-                await interaction.response.send_message(
-                    "I haven't learned any specific facts about you yet. "
-                    "We'll get to know each other as we chat!"
-                )
+                await interaction.response.send_message(NO_FACTS_TEXT)
             else:
                 facts_text = "\n".join(f"• {fact}" for fact in facts)
                 await interaction.response.send_message(
@@ -148,89 +186,141 @@ class DiscordBot:
         async def forget_command(interaction: discord.Interaction):
             if not self._is_allowed_user(interaction.user.id):
                 await interaction.response.send_message(
-                    "You are not authorized to use this bot.", ephemeral=True
+                    NOT_AUTHORIZED_TEXT, ephemeral=True
                 )
                 return
 
-            await interaction.response.send_message(
-                "Memory clearing is not implemented yet. "
-                "If you need to reset, you can delete the Qdrant data volume."
-            )
+            await interaction.response.send_message(FORGET_TEXT)
+
+    async def _chat_worker(self, queue: asyncio.Queue) -> None:
+        """Process queued messages of a single channel one at a time."""
+        while True:
+            message = await queue.get()
+            try:
+                await self._handle_message(message)
+            except Exception as e:
+                logger.error(
+                    f"Error processing queued Discord message: {e}", exc_info=True
+                )
+            finally:
+                queue.task_done()
 
     async def _handle_message(self, message: discord.Message) -> None:
         """Handle an incoming DM from the allowed user."""
         user_message = message.content
         logger.info(f"Received Discord DM: {user_message[:50]}...")
 
+        # Set once the placeholder is sent and once the reply is complete
+        sent = None
+        response = None
+
         # Show typing indicator
         async with message.channel.typing():
             try:
-                # Get relevant context from memory
-                relevant_history = self.memory.get_relevant_history(
-                    user_message, limit=5
+                # Embed the message once (while fetching recent history) and reuse
+                # the vector for both similarity searches
+                query_vector, recent_history = await asyncio.gather(
+                    self.embedder.embed(user_message),
+                    self.memory.get_recent_history(limit=10),
+                )
+                # Short messages carry too little meaning for a similarity search
+                searchable = is_searchable_query(user_message)
+                if searchable:
+                    relevant_history, relevant_facts = (
+                        await self.memory.get_relevant_context_by_vector(query_vector)
+                    )
+                else:
+                    relevant_history, relevant_facts = [], []
+
+                # Merge histories (both are sorted by timestamp) and drop duplicates,
+                # preferring recent but including relevant
+                combined_history = list(
+                    {
+                        (msg["role"], msg["timestamp"]): msg
+                        for msg in merge(
+                            recent_history,
+                            relevant_history,
+                            key=itemgetter("timestamp"),
+                        )
+                    }.values()
                 )
-                recent_history = self.memory.get_recent_history(limit=10)
-                relevant_facts = self.memory.get_relevant_facts(user_message, limit=5)
-
-                # Combine histories, preferring recent but including relevant
-                history_ids = set()
-                combined_history = []
-
-                for msg in recent_history:
-                    msg_key = f"{msg['role']}:{msg['timestamp']}"
-                    if msg_key not in history_ids:
-                        history_ids.add(msg_key)
-                        combined_history.append(msg)
-
-                for msg in relevant_history:
-                    msg_key = f"{msg['role']}:{msg['timestamp']}"
-                    if msg_key not in history_ids:
-                        history_ids.add(msg_key)
-                        combined_history.append(msg)
 
-                # Sort by timestamp
-                combined_history.sort(key=lambda m: m["timestamp"])
+                # Keep the prompt within the history token budget, newest first
+                combined_history = trim_history(combined_history)
 
-                # Build system prompt with facts
+                # The system prompt stays identical across turns (so the model server
+                # can reuse its cached prefix); date and facts go in a separate message
                 system_prompt = self.character.get_system_prompt()
+                context_prompt = self.character.get_context_prompt()
                 if relevant_facts:
-                    facts_text = "\n".join(f"- {f}" for f in relevant_facts)
-                    system_prompt += (
+                    facts_text = "- " + "\n- ".join(relevant_facts)
+                    context_prompt += (
                         f"\n\n## What you know about the user:\n{facts_text}"
                     )
 
-                # Generate response
-                response = self.llm.generate_response(
+                # Extract and store new facts in the background while the response
+                # is generated (don't wait for this)
+                self._run_in_background(self._extract_and_store_facts(user_message))
+
+                # Send a placeholder and fill it in as the response streams in
+                sent = await message.reply(STREAMING_PLACEHOLDER)
+                response = await stream_reply(
+                    self.llm,
+                    lambda text: sent.edit(content=text),
                     system_prompt=system_prompt,
                     messages=combined_history,
                     user_message=user_message,
+                    # Short messages like "ok" mean something different in every
+                    # conversation, so they never go through the response cache
+                    query_embedding=query_vector if searchable else None,
+                    context=context_prompt,
+                    use_cache=searchable,
                 )
+                logger.info(f"Sent Discord response: {response[:50]}...")
 
                 # Store the conversation
-                self.memory.add_message("user", user_message)
-                self.memory.add_message("assistant", response)
-
-                # Extract and store new facts (don't wait for this)
-                self._extract_and_store_facts(user_message)
-
-                # Send response
-                await message.reply(response)
-                logger.info(f"Sent Discord response: {response[:50]}...")
+                await self.memory.add_message(
+                    "user",
+                    user_message,
+                    embedding=query_vector,
+                )
+                if response:
+                    await self.memory.add_message("assistant", response)
 
             except Exception as e:
                 logger.error(f"Error handling Discord message: {e}", exc_info=True)
-                await message.reply(
-                    "Sorry, I had trouble processing that. Could you try again?"
-                )
-
-    def _extract_and_store_facts(self, user_message: str) -> None:
+                if sent is None:
+                    await message.reply(ERROR_RESPONSE_TEXT)
+                elif response is None:
+                    # Replace the placeholder or partial reply instead of leaving
+                    # it behind; a complete reply stays as it is
+                    await sent.edit(content=ERROR_RESPONSE_TEXT)
+
+    def _run_in_background(self, coro) -> None:
+        """Run a coroutine as a task without awaiting it."""
+        task = asyncio.create_task(coro)
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _extract_and_store_facts(self, user_message: str) -> None:
         """Extract facts from user message and store them."""
         try:
-            existing_facts = self.memory.get_all_facts()
-            new_facts = self.llm.extract_facts(user_message, existing_facts)
+            # Served from the memory manager's in-process facts cache
+            existing_facts_text = await self.memory.get_facts_text()
+            new_facts = await self.llm.extract_facts(user_message, existing_facts_text)
+
+            known_facts = set(await self.memory.get_all_facts())
+            new_facts = [
+                fact for fact in dict.fromkeys(new_facts) if fact not in known_facts
+            ]
+            if not new_facts:
+                return
 
+            # Embed all new facts in one call and store them in one upsert
+            embeddings = await self.llm.embed_batch(new_facts)
+            await self.memory.add_facts(new_facts, embeddings)
             for fact in new_facts:
-                self.memory.add_fact(fact)
                 logger.info(f"Stored new fact: {fact}")
 
         except Exception as e:
@@ -260,7 +350,7 @@ class DiscordBot:
             await self._allowed_user.send(message)
 
             # Store the proactive message in memory
-            self.memory.add_message("assistant", message)
+            await self.memory.add_message("assistant", message)
 
             logger.info(f"Sent proactive Discord DM: {message[:50]}...")
             return True
@@ -297,18 +387,34 @@ class DiscordBot:
         await self.client.start(self.token)
 
     async def close(self) -> None:
-        """Close the Discord bot connection."""
+        """Stop the chat workers and background tasks, then disconnect."""
+        for worker in self._chat_workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._chat_workers.values(), return_exceptions=True)
+
+        # Let in-flight background work (e.g. fact extraction) finish so its
+        # writes reach memory before it is closed
+        if self._background_tasks:
+            _, pending = await asyncio.wait(
+                self._background_tasks, timeout=BACKGROUND_TASK_TIMEOUT
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
         await self.client.close()
 
 
-def create_discord_bot() -> DiscordBot | None:
+def create_discord_bot(services: Services) -> DiscordBot | None:
     """Create a DiscordBot instance from environment variables.
 
+    Args:
+        services: Shared LLM, memory and embedding services
+
     Returns:
         DiscordBot instance if Discord is configured, None otherwise
     """
     from .character import load_character
-    from .tools import create_default_registry
 
     token = os.getenv("DISCORD_BOT_TOKEN")
     if not token:
@@ -329,22 +435,12 @@ def create_discord_bot() -> DiscordBot | None:
             f"DISCORD_USER_ID must be an integer, got: {user_id_str}"
         ) from exc
 
-    # Load character
+    # Load character (per bot, since each platform sets its own user name)
     character = load_character()
 
-    # Create tool registry with default tools (calendar, reminders)
-    tool_registry = create_default_registry()
-
-    # Create LLM client with tools
-    llm = LLMClient(tool_registry=tool_registry)
-
-    # Create memory manager with embedding function
-    memory = MemoryManager(embed_func=llm.embed)
-
     return DiscordBot(
         token=token,
         allowed_user_id=allowed_user_id,
         character=character,
-        llm=llm,
-        memory=memory,
+        services=services,
     )
@@ -0,0 +1,94 @@
+"""Micro-batching of embedding requests."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# How long to wait for more requests before flushing a batch
+BATCH_WINDOW_SECONDS = 0.03
+
+# Maximum number of texts embedded in one call
+MAX_BATCH_SIZE = 32
+
+
+class BatchEmbedder:
+    """Collects embedding requests within a short window and embeds them together."""
+
+    def __init__(
+        self,
+        embed_batch_func: Callable[[list[str]], Awaitable[list[list[float]]]],
+        window: float = BATCH_WINDOW_SECONDS,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ):
+        """
+        Initialize the batch embedder.
+
+        Args:
+            embed_batch_func: Coroutine function that embeds a list of texts
+            window: Seconds to wait for further requests before flushing
+            max_batch_size: Maximum number of texts per batch
+        """
+        self.embed_batch_func = embed_batch_func
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def embed(self, text: str) -> list[float]:
+        """
+        Embed a text as part of the next batch.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector as list of floats
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """Start the batching worker on the running event loop if needed."""
+        if self._worker is not None and not self._worker.done():
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._worker = self._loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Collect queued requests into batches and embed them."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.window
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                embeddings = await self.embed_batch_func(texts)
+            except Exception as e:
+                logger.error(f"Failed to embed batch of {len(texts)} texts: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
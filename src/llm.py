@@ -1,20 +1,45 @@
 """Ollama LLM client wrapper with tool calling support."""
 
-import json
+import asyncio
+import hashlib
 import logging
 import os
-from typing import Optional
+import re
+from collections import OrderedDict
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Optional
 
 import ollama
+import orjson
 
 from .tools import ToolExecutor, ToolRegistry
 
+if TYPE_CHECKING:
+    from .memory import SemanticCache
+
 logger = logging.getLogger(__name__)
 
 # Model configuration (can be overridden via environment variables)
 CHAT_MODEL = os.getenv("OLLAMA_CHAT_MODEL", "gpt-oss:20b")
 EMBEDDING_MODEL = os.getenv("OLLAMA_EMBED_MODEL", "nomic-embed-text")
 
+# Maximum concurrent chat requests; match the server's OLLAMA_NUM_PARALLEL
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "2"))
+
+# How long Ollama keeps the models loaded after a request
+KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+# Load both models at startup so the first message doesn't wait for them
+WARMUP = os.getenv("OLLAMA_WARMUP") == "1"
+
+# How speakers are labelled when recent messages are summarized for the model
+SPEAKER_LABELS = {"user": "User"}
+
+# Skip the startup check for installed models (e.g. behind a proxy without /api/tags)
+SKIP_MODEL_CHECK = os.getenv("OLLAMA_SKIP_MODEL_CHECK") == "1"
+
+# Hosts whose installed models were already checked in this process
+_checked_hosts: set[str] = set()
+
 # Creative settings for the chat model
 CHAT_OPTIONS = {
     "temperature": 0.8,
@@ -34,6 +59,195 @@ TOOL_CALL_OPTIONS = {
 # Maximum number of tool call iterations to prevent infinite loops
 MAX_TOOL_ITERATIONS = 5
 
+# Put between text streamed before a tool call and the answer after it
+TURN_SEPARATOR = "\n\n"
+
+# Number of recent embeddings kept in memory to avoid re-embedding the same text
+EMBEDDING_CACHE_SIZE = 4096
+
+# One extracted fact per line, optionally "- " bulleted; "#" headings are skipped
+FACT_LINE_RE = re.compile(r"^[^\S\n]*(?:-[^\S\n]+)?(?!#)(\S.*?)[^\S\n]*$", re.MULTILINE)
+
+# Token budget for conversation history included in a prompt
+HISTORY_TOKEN_BUDGET = 2000
+
+# Share of the history token budget reserved for messages found by
+# similarity search, so older relevant messages aren't always trimmed first
+RELEVANT_HISTORY_SHARE = 0.25
+
+# Rough average of characters per token for English text
+CHARS_PER_TOKEN = 4
+
+# Minimum seconds between edits of a message while a response streams in
+STREAM_EDIT_INTERVAL = 0.4
+
+# Shown instead of the placeholder when the model returns no text
+EMPTY_RESPONSE_TEXT = "Sorry, I'm not sure what to say to that. Could you rephrase?"
+
+
+def count_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Ollama does not expose its tokenizer, so this uses a characters-per-token
+    heuristic, which is accurate enough for budgeting prompt size.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def trim_history(
+    messages: list[dict],
+    max_tokens: int = HISTORY_TOKEN_BUDGET,
+    relevant_share: float = RELEVANT_HISTORY_SHARE,
+) -> list[dict]:
+    """
+    Keep the newest and the most relevant messages that fit within a token budget.
+
+    Up to relevant_share of the budget goes to messages found by similarity
+    search (those with a "score"), highest score first, so they aren't
+    always the first to go just because they are older. The rest of the
+    budget is filled with the newest messages.
+
+    Args:
+        messages: Conversation history sorted by timestamp
+        max_tokens: Maximum total tokens of the kept messages
+        relevant_share: Fraction of max_tokens reserved for relevant messages
+
+    Returns:
+        The kept messages, still sorted by timestamp
+    """
+    sizes = [count_tokens(message["content"]) for message in messages]
+    kept = set()
+    used = 0
+
+    relevant_budget = max_tokens * relevant_share
+    relevant = [i for i, message in enumerate(messages) if "score" in message]
+    relevant.sort(key=lambda i: messages[i]["score"], reverse=True)
+    for i in relevant:
+        if used + sizes[i] <= relevant_budget:
+            kept.add(i)
+            used += sizes[i]
+
+    for i in range(len(messages) - 1, -1, -1):
+        if i in kept:
+            continue
+        used += sizes[i]
+        if used > max_tokens:
+            break
+        kept.add(i)
+
+    return [messages[i] for i in sorted(kept)]
+
+
+async def stream_reply(
+    llm: "LLMClient", edit: Callable[[str], Awaitable], **kwargs
+) -> str:
+    """
+    Stream a generated response into an already sent message.
+
+    The message is edited at most once per STREAM_EDIT_INTERVAL seconds
+    to stay within rate limits, and once more with the final text. Only
+    the final edit can fail the reply.
+
+    Args:
+        llm: Client that generates the response
+        edit: Coroutine function that replaces the message text
+        **kwargs: Arguments for LLMClient.generate_response
+
+    Returns:
+        The complete response text, or "" if the model produced none
+    """
+    loop = asyncio.get_running_loop()
+    parts: list[str] = []
+    shown = ""
+    last_edit = loop.time()
+
+    async for chunk in llm.generate_response(**kwargs):
+        parts.append(chunk)
+        if loop.time() - last_edit >= STREAM_EDIT_INTERVAL:
+            text = "".join(parts)
+            if text.strip() and text != shown:
+                # A failed intermediate edit (e.g. rate limited) only
+                # delays the update; the final edit shows everything
+                try:
+                    await edit(text)
+                    shown = text
+                except Exception as e:
+                    logger.warning(f"Failed to update streamed reply: {e}")
+                last_edit = loop.time()
+
+    response = "".join(parts)
+    if not response.strip():
+        # Don't leave the placeholder behind or store an empty reply
+        await edit(EMPTY_RESPONSE_TEXT)
+        return ""
+    if response != shown:
+        await edit(response)
+    return response
+
+
+class EmbeddingCache:
+    """LRU cache of embeddings keyed by a hash of the embedded text."""
+
+    def __init__(self, maxsize: int = EMBEDDING_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of embeddings kept
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, list[float]] = OrderedDict()
+
+        # Lookup counters, to judge whether the cache size fits the workload
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Hash the text so long prompts don't stay in memory as keys."""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def get(self, text: str) -> Optional[list[float]]:
+        """Return the cached embedding for a text, or None if not cached."""
+        key = self._key(text)
+        embedding = self._entries.get(key)
+        if embedding is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return embedding
+
+    def put(self, text: str, embedding: list[float]) -> None:
+        """Cache an embedding, evicting the least recently used if full."""
+        key = self._key(text)
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# Shared by every LLMClient so all code paths reuse each other's embeddings
+embedding_cache = EmbeddingCache()
+
+# One Ollama client per host, so every LLMClient shares its connection pool
+_shared_clients: dict[str, ollama.AsyncClient] = {}
+
+
+def _get_shared_client(host: str) -> ollama.AsyncClient:
+    """Return the shared Ollama client for a host, creating it on first use."""
+    client = _shared_clients.get(host)
+    if client is None:
+        client = _shared_clients[host] = ollama.AsyncClient(host=host)
+    return client
+
 
 class LLMClient:
     """Client for interacting with Ollama with tool calling support."""
@@ -42,6 +256,7 @@ class LLMClient:
         self,
         host: Optional[str] = None,
         tool_registry: Optional[ToolRegistry] = None,
+        response_cache: Optional["SemanticCache"] = None,
     ):
         """
         Initialize the LLM client.
@@ -49,190 +264,271 @@ class LLMClient:
         Args:
             host: Ollama host URL (defaults to OLLAMA_HOST env var)
             tool_registry: Registry of tools available for the LLM to use
+            response_cache: Optional semantic cache for generated responses
         """
         self.host = host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
-        self.client = ollama.Client(host=self.host)
+        self.client = _get_shared_client(self.host)
 
         # Tool calling setup
         self.tool_registry = tool_registry
         self.tool_executor = ToolExecutor(tool_registry) if tool_registry else None
 
-        # Verify models are available
-        self._check_models()
+        # Bound concurrent chat requests so bursts (replies, fact extraction,
+        # proactive messages) queue here instead of slowing each other down
+        # at the server
+        self._chat_gate = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+
+        # Semantic response cache (consulted when a query embedding is given)
+        self.response_cache = response_cache
+
+        # Cache embeddings so the same text (e.g. a user message used for
+        # several memory lookups and then stored) is only embedded once
+        self.embedding_cache = embedding_cache
+
+    async def check_models(self) -> None:
+        """Check that required models are available (once per host and process)."""
+        if SKIP_MODEL_CHECK or self.host in _checked_hosts:
+            return
 
-    def _check_models(self) -> None:
-        """Check that required models are available."""
         try:
-            models = self.client.list()
-            model_names = [m.model for m in models.models]
+            models = await self.client.list()
+            # Compare without tags, e.g. "nomic-embed-text:latest"
+            model_names = {m.model.split(":")[0] for m in models.models}
 
-            # Check for chat model (allow partial match for tags)
-            chat_model_base = CHAT_MODEL.split(":")[0]
-            if not any(chat_model_base in name for name in model_names):
+            # Check for chat model
+            if CHAT_MODEL.split(":")[0] not in model_names:
                 logger.warning(
                     f"Chat model '{CHAT_MODEL}' not found. "
-                    f"Available models: {model_names}. "
+                    f"Available models: {sorted(model_names)}. "
                     f"Please run: ollama pull {CHAT_MODEL}"
                 )
 
             # Check for embedding model
-            embed_model_base = EMBEDDING_MODEL.split(":")[0]
-            if not any(embed_model_base in name for name in model_names):
+            if EMBEDDING_MODEL.split(":")[0] not in model_names:
                 logger.warning(
                     f"Embedding model '{EMBEDDING_MODEL}' not found. "
                     f"Please run: ollama pull {EMBEDDING_MODEL}"
                 )
+            _checked_hosts.add(self.host)
         except Exception as e:
             logger.error(f"Failed to check models: {e}")
 
+    async def warm_up(self) -> None:
+        """Load the chat and embedding models into memory if OLLAMA_WARMUP is set."""
+        if not WARMUP:
+            return
+
+        try:
+            # An empty chat only loads the model, nothing is generated
+            await asyncio.gather(
+                self.client.chat(model=CHAT_MODEL, messages=[], keep_alive=KEEP_ALIVE),
+                self.client.embed(
+                    model=EMBEDDING_MODEL, input=" ", keep_alive=KEEP_ALIVE
+                ),
+            )
+            logger.info("Models loaded")
+        except Exception as e:
+            logger.warning(f"Failed to warm up models: {e}")
+
     def _get_tools_for_ollama(self) -> list[dict] | None:
         """Get tools in Ollama format, or None if no tools available."""
         if not self.tool_registry or len(self.tool_registry) == 0:
             return None
         return self.tool_registry.get_ollama_tools()
 
-    def generate_response(
+    async def generate_response(
         self,
         system_prompt: str,
         messages: list[dict],
         user_message: str,
-    ) -> str:
+        query_embedding: Optional[list[float]] = None,
+        context: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
         """
         Generate a response using the chat model, with tool calling support.
 
+        The response is streamed: text is yielded as the model produces it,
+        including the turns that follow tool calls. Text of a turn that ended
+        in tool calls is separated from the next turn's text by a blank line.
+
         Args:
             system_prompt: The system prompt (character definition)
             messages: Recent conversation history as list of {"role": ..., "content": ...}
             user_message: The current user message
-
-        Returns:
-            The generated response text
+            query_embedding: Embedding of user_message, used as the response cache key;
+                computed in the background during generation when omitted
+            context: Per-message context (date, facts) sent as a separate system
+                message so the system prompt stays identical across calls
+            use_cache: Whether the response cache may answer and store this
+                message; off for messages whose meaning depends on context
+
+        Yields:
+            Consecutive chunks of the response text
         """
-        # Build the full message list
-        full_messages = [
-            {"role": "system", "content": system_prompt},
-        ]
-
-        # Add conversation history
-        for msg in messages:
-            full_messages.append(
-                {
-                    "role": msg["role"],
-                    "content": msg["content"],
-                }
-            )
-
-        # Add the current user message
-        full_messages.append(
-            {
-                "role": "user",
-                "content": user_message,
-            }
+        use_cache = use_cache and self.response_cache is not None
+        embedding_task: Optional[asyncio.Task] = None
+
+        # Serve semantically equivalent messages straight from the cache
+        if use_cache and query_embedding is not None:
+            # In-memory lookup, cheap enough to run on the event loop
+            cached = self.response_cache.query(query_embedding)
+            if cached is not None:
+                logger.info("Semantic cache hit, skipping generation")
+                yield cached
+                return
+        elif use_cache:
+            # Without a cache key, embed the message while the model generates
+            # so the response can still be stored afterwards
+            embedding_task = asyncio.create_task(self.embed(user_message))
+
+        current_messages = self._build_messages(
+            system_prompt, messages, user_message, context
         )
-
-        # Get tools if available
         tools = self._get_tools_for_ollama()
+        parts: list[str] = []
+        used_tools = False
+        # Set when text shown so far ended with a turn that called tools
+        needs_separator = False
 
         try:
-            if tools:
-                return self._generate_with_tools(full_messages, tools)
+            for iteration in range(1, MAX_TOOL_ITERATIONS + 1):
+                # Use lower temperature for tool calling
+                options = (
+                    TOOL_CALL_OPTIONS if tools and iteration == 1 else CHAT_OPTIONS
+                )
+
+                content_parts: list[str] = []
+                tool_calls = []
+                async with self._chat_gate:
+                    async for chunk in await self.client.chat(
+                        model=CHAT_MODEL,
+                        messages=current_messages,
+                        tools=tools,
+                        options=options,
+                        keep_alive=KEEP_ALIVE,
+                        stream=True,
+                    ):
+                        if chunk.message.tool_calls:
+                            tool_calls.extend(chunk.message.tool_calls)
+                        if chunk.message.content:
+                            # Keep text from before a tool call apart from the
+                            # answer that follows it
+                            if needs_separator:
+                                needs_separator = False
+                                parts.append(TURN_SEPARATOR)
+                                yield TURN_SEPARATOR
+                            content_parts.append(chunk.message.content)
+                            parts.append(chunk.message.content)
+                            yield chunk.message.content
+
+                # No tool calls, the response is complete
+                if not tool_calls:
+                    break
+
+                logger.info(f"Model requested {len(tool_calls)} tool call(s)")
+                used_tools = True
+                needs_separator = needs_separator or bool(content_parts)
+                await self._execute_tool_calls(
+                    current_messages, "".join(content_parts), tool_calls
+                )
             else:
-                return self._generate_simple(full_messages)
+                logger.warning(
+                    f"Tool calling exceeded {MAX_TOOL_ITERATIONS} iterations"
+                )
+                if not parts:
+                    yield "I'm having trouble processing that request."
+                    return
+
+            # Tool results depend on live data, so only plain responses are cached
+            if use_cache and not used_tools and parts:
+                # The reply is already out, so a failure here only skips caching
+                try:
+                    if embedding_task is not None:
+                        query_embedding = await embedding_task
+                    await self.response_cache.update(query_embedding, "".join(parts))
+                except Exception as e:
+                    logger.warning(f"Failed to cache response: {e}")
         except Exception as e:
             logger.error(f"Failed to generate response: {e}")
             raise
+        finally:
+            # Also runs when the consumer is cancelled or stops iterating early;
+            # cancelling an already finished task does nothing
+            if embedding_task is not None:
+                embedding_task.cancel()
 
-    def _generate_simple(self, messages: list[dict]) -> str:
-        """Generate a response without tool calling."""
-        response = self.client.chat(
-            model=CHAT_MODEL,
-            messages=messages,
-            options=CHAT_OPTIONS,
-        )
-        return response.message.content
-
-    def _generate_with_tools(self, messages: list[dict], tools: list[dict]) -> str:
-        """Generate a response with tool calling support."""
-        current_messages = messages.copy()
-        iterations = 0
-
-        while iterations < MAX_TOOL_ITERATIONS:
-            iterations += 1
-
-            # Use lower temperature for tool calling
-            options = TOOL_CALL_OPTIONS if iterations == 1 else CHAT_OPTIONS
+    def _build_messages(
+        self,
+        system_prompt: str,
+        messages: list[dict],
+        user_message: str,
+        context: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Build the full message list sent to the chat model.
 
-            response = self.client.chat(
-                model=CHAT_MODEL,
-                messages=current_messages,
-                tools=tools,
-                options=options,
+        The system prompt always comes first so the server can reuse its
+        cached prefix; the per-message context goes right before the user
+        message. History entries are passed through without copying; the
+        Ollama client only reads their role and content and ignores other keys.
+        """
+        full_messages = [{"role": "system", "content": system_prompt}, *messages]
+        if context:
+            full_messages.append({"role": "system", "content": context})
+        full_messages.append({"role": "user", "content": user_message})
+        return full_messages
+
+    async def _execute_tool_calls(
+        self, messages: list[dict], content: str, tool_calls: list
+    ) -> None:
+        """Run the requested tools and append the call and its results to messages."""
+        call_dicts = []
+        executions = []
+
+        # Record each tool call and start executing it in a single pass
+        for tool_call in tool_calls:
+            tool_name = tool_call.function.name
+            tool_args = tool_call.function.arguments
+            call_dicts.append(
+                {
+                    "id": tool_name,  # Ollama doesn't provide IDs, use name
+                    "type": "function",
+                    "function": {
+                        "name": tool_name,
+                        "arguments": tool_args,
+                    },
+                }
             )
 
-            # Check if the model wants to call tools
-            if response.message.tool_calls:
-                logger.info(
-                    f"Model requested {len(response.message.tool_calls)} tool call(s)"
-                )
-
-                # Add the assistant's response with tool calls
-                current_messages.append(
-                    {
-                        "role": "assistant",
-                        "content": response.message.content or "",
-                        "tool_calls": [
-                            {
-                                "id": tc.function.name,  # Ollama doesn't provide IDs, use name
-                                "type": "function",
-                                "function": {
-                                    "name": tc.function.name,
-                                    "arguments": tc.function.arguments,
-                                },
-                            }
-                            for tc in response.message.tool_calls
-                        ],
-                    }
-                )
-
-                # Execute each tool and add results
-                for tool_call in response.message.tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_args = tool_call.function.arguments
+            # Arguments may be a dict or a JSON string depending on Ollama version
+            if isinstance(tool_args, str):
+                try:
+                    tool_args = orjson.loads(tool_args)
+                except orjson.JSONDecodeError:
+                    tool_args = {}
 
-                    # Arguments may be a dict or a JSON string depending on Ollama version
-                    if isinstance(tool_args, str):
-                        try:
-                            tool_args = json.loads(tool_args)
-                        except json.JSONDecodeError:
-                            tool_args = {}
-
-                    # Execute the tool
-                    result = self.tool_executor.execute(tool_name, tool_args)
-
-                    # Add tool result to messages
-                    current_messages.append(
-                        {
-                            "role": "tool",
-                            "content": result,
-                        }
-                    )
-
-                # Continue the loop to let the model process tool results
-                continue
+            # Tools are blocking, so each runs in its own worker thread
+            executions.append(
+                asyncio.to_thread(self.tool_executor.execute, tool_name, tool_args)
+            )
 
-            # No tool calls, return the final response
-            return response.message.content
+        # Independent tool calls run concurrently; results keep the call order
+        results = await asyncio.gather(*executions)
 
-        # Exceeded max iterations
-        logger.warning(f"Tool calling exceeded {MAX_TOOL_ITERATIONS} iterations")
-        return response.message.content or "I'm having trouble processing that request."
+        # Add the assistant's response with tool calls, followed by the results
+        messages.append(
+            {"role": "assistant", "content": content, "tool_calls": call_dicts}
+        )
+        messages.extend({"role": "tool", "content": result} for result in results)
 
-    def generate_proactive_message(
+    async def generate_proactive_message(
         self,
         system_prompt: str,
         proactive_prompt: str,
         recent_messages: list[dict],
-        user_facts: list[str],
+        user_facts_text: str,
+        context: Optional[str] = None,
     ) -> str:
         """
         Generate a proactive message to send to the user.
@@ -241,29 +537,28 @@ class LLMClient:
             system_prompt: The character system prompt
             proactive_prompt: Instructions for generating the proactive message
             recent_messages: Recent conversation history
-            user_facts: Known facts about the user
+            user_facts_text: Known facts about the user as a "- " bulleted list
+            context: Per-message context (date), sent after the system prompt
 
         Returns:
             The generated proactive message
         """
         # Build context about the user
-        facts_text = (
-            "\n".join(f"- {fact}" for fact in user_facts)
-            if user_facts
-            else "No specific facts recorded yet."
-        )
+        facts_text = user_facts_text or "No specific facts recorded yet."
 
         # Build recent conversation summary
         recent_text = ""
         if recent_messages:
-            recent_text = "\n\nRecent conversation:\n"
+            parts = ["\n\nRecent conversation:\n"]
             for msg in recent_messages[-5:]:  # Last 5 messages
-                role = "User" if msg["role"] == "user" else "You"
-                recent_text += (
-                    f"{role}: {msg['content'][:200]}...\n"
-                    if len(msg["content"]) > 200
-                    else f"{role}: {msg['content']}\n"
+                role = SPEAKER_LABELS.get(msg["role"], "You")
+                content = msg["content"]
+                parts.append(
+                    f"{role}: {content[:200]}...\n"
+                    if len(content) > 200
+                    else f"{role}: {content}\n"
                 )
+            recent_text = "".join(parts)
 
         prompt = f"""{proactive_prompt}
 
@@ -273,42 +568,37 @@ What you know about the user:
 
 Generate a natural, in-character message to send. Just write the message itself, nothing else."""
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt},
-        ]
+        messages = self._build_messages(system_prompt, [], prompt, context)
 
         try:
-            response = self.client.chat(
-                model=CHAT_MODEL,
-                messages=messages,
-                options=CHAT_OPTIONS,
-            )
+            async with self._chat_gate:
+                response = await self.client.chat(
+                    model=CHAT_MODEL,
+                    messages=messages,
+                    options=CHAT_OPTIONS,
+                    keep_alive=KEEP_ALIVE,
+                )
             return response.message.content.strip()
         except Exception as e:
             logger.error(f"Failed to generate proactive message: {e}")
             raise
 
-    def extract_facts(
+    async def extract_facts(
         self,
         user_message: str,
-        existing_facts: list[str],
+        existing_facts_text: str,
     ) -> list[str]:
         """
         Extract new facts about the user from their message.
 
         Args:
             user_message: The user's message
-            existing_facts: Facts we already know
+            existing_facts_text: Facts we already know as a "- " bulleted list
 
         Returns:
             List of new facts (empty if none found)
         """
-        existing_text = (
-            "\n".join(f"- {f}" for f in existing_facts)
-            if existing_facts
-            else "None recorded yet."
-        )
+        existing_text = existing_facts_text or "None recorded yet."
 
         prompt = f"""Analyze this user message and extract any personal facts about them that would be worth remembering for future conversations.
 
@@ -330,51 +620,78 @@ If there are no new facts worth remembering, respond with exactly: NONE
 Be selective - only extract meaningful, personal facts, not trivial conversation details."""
 
         try:
-            response = self.client.chat(
-                model=CHAT_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                options={
-                    "temperature": 0.3
-                },  # Lower temperature for factual extraction
-            )
+            async with self._chat_gate:
+                response = await self.client.chat(
+                    model=CHAT_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    options={
+                        "temperature": 0.3
+                    },  # Lower temperature for factual extraction
+                    keep_alive=KEEP_ALIVE,
+                )
 
             content = response.message.content.strip()
 
             if content == "NONE" or not content:
                 return []
 
-            # Parse facts from response
-            facts = []
-            for line in content.split("\n"):
-                line = line.strip()
-                if line.startswith("- "):
-                    facts.append(line[2:])
-                elif line and not line.startswith("#"):
-                    # Handle lines without bullet points
-                    facts.append(line)
-
-            return facts
+            # Parse facts from response (bullet points are optional)
+            return FACT_LINE_RE.findall(content)
 
         except Exception as e:
             logger.error(f"Failed to extract facts: {e}")
             return []
 
-    def embed(self, text: str) -> list[float]:
+    async def embed(self, text: str) -> list[float]:
         """
         Generate an embedding for the given text.
 
+        Recently embedded texts are served from an in-memory LRU cache.
+
         Args:
             text: Text to embed
 
         Returns:
             Embedding vector as list of floats
         """
-        try:
-            response = self.client.embed(
-                model=EMBEDDING_MODEL,
-                input=text,
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for several texts with a single Ollama call.
+
+        Texts found in the LRU cache are not sent to Ollama again.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in the same order as the texts
+        """
+        embeddings: dict[str, list[float]] = {}
+        for text in texts:
+            cached = self.embedding_cache.get(text)
+            if cached is not None:
+                embeddings[text] = cached
+
+        missing = [text for text in dict.fromkeys(texts) if text not in embeddings]
+        if missing:
+            logger.debug(
+                f"Embedding {len(missing)} text(s), cache hits/misses so far: "
+                f"{self.embedding_cache.hits}/{self.embedding_cache.misses}"
             )
-            return response.embeddings[0]
-        except Exception as e:
-            logger.error(f"Failed to generate embedding: {e}")
-            raise
+            try:
+                response = await self.client.embed(
+                    model=EMBEDDING_MODEL,
+                    input=missing,
+                    keep_alive=KEEP_ALIVE,
+                )
+            except Exception as e:
+                logger.error(f"Failed to generate embedding: {e}")
+                raise
+
+            for text, embedding in zip(missing, response.embeddings):
+                embeddings[text] = embedding
+                self.embedding_cache.put(text, embedding)
+
+        return [embeddings[text] for text in texts]
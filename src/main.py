@@ -7,6 +7,7 @@ import signal
 import sys
 
 from .scheduler import ProactiveScheduler
+from .services import Services, create_services
 
 # Configure logging
 logging.basicConfig(
@@ -20,12 +21,12 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
-async def run_telegram_bot(stop_event: asyncio.Event) -> None:
+async def run_telegram_bot(stop_event: asyncio.Event, services: Services) -> None:
     """Run the Telegram bot."""
     from .bot import create_bot
 
     try:
-        bot = create_bot()
+        bot = create_bot(services)
         logger.info(f"Telegram bot created with character: {bot.character.name}")
     except ValueError as e:
         logger.error(f"Failed to create Telegram bot: {e}")
@@ -53,12 +54,27 @@ async def run_telegram_bot(stop_event: asyncio.Event) -> None:
         # Start the scheduler
         scheduler.start()
 
-        # Start polling for Telegram updates
         await application.start()
-        await application.updater.start_polling(
-            allowed_updates=["message"],
-            drop_pending_updates=True,
-        )
+
+        if bot.webhook_url:
+            # Let Telegram push updates to us as they happen
+            await application.updater.start_webhook(
+                listen="0.0.0.0",
+                port=bot.webhook_port,
+                url_path=bot.token,
+                webhook_url=f"{bot.webhook_url.rstrip('/')}/{bot.token}",
+                allowed_updates=["message"],
+                drop_pending_updates=True,
+            )
+            logger.info(
+                f"Telegram: receiving updates via webhook on port {bot.webhook_port}"
+            )
+        else:
+            # Start polling for Telegram updates
+            await application.updater.start_polling(
+                allowed_updates=["message"],
+                drop_pending_updates=True,
+            )
 
         logger.info("Telegram bot is running!")
 
@@ -78,16 +94,17 @@ async def run_telegram_bot(stop_event: asyncio.Event) -> None:
             await application.updater.stop()
 
         await application.stop()
+        await bot.close()
         await application.shutdown()
 
         logger.info("Telegram bot stopped.")
 
 
-async def run_discord_bot(stop_event: asyncio.Event) -> None:
+async def run_discord_bot(stop_event: asyncio.Event, services: Services) -> None:
     """Run the Discord bot."""
     from .discord_bot import create_discord_bot
 
-    bot = create_discord_bot()
+    bot = create_discord_bot(services)
     if bot is None:
         logger.info("Discord bot not configured, skipping")
         return
@@ -168,16 +185,23 @@ async def main() -> None:
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    # One LLM client and memory store shared by all bots
+    services = await create_services()
+    await services.llm.check_models()
+
+    # Load the models in the background while the bots connect
+    warmup_task = asyncio.create_task(services.llm.warm_up())
+
     # Collect tasks for configured bots
     tasks = []
 
     if telegram_configured:
         logger.info("Telegram bot is configured")
-        tasks.append(asyncio.create_task(run_telegram_bot(stop_event)))
+        tasks.append(asyncio.create_task(run_telegram_bot(stop_event, services)))
 
     if discord_configured:
         logger.info("Discord bot is configured")
-        tasks.append(asyncio.create_task(run_discord_bot(stop_event)))
+        tasks.append(asyncio.create_task(run_discord_bot(stop_event, services)))
 
     # Wait for all bot tasks to complete
     if tasks:
@@ -190,8 +214,23 @@ async def main() -> None:
 
         await asyncio.gather(*tasks)
 
+    # Don't leave the warm-up running if we stop before the models loaded
+    warmup_task.cancel()
+    try:
+        await warmup_task
+    except asyncio.CancelledError:
+        pass
+
+    # Write any buffered messages before exiting
+    await services.memory.close()
     logger.info("All bots stopped.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        # libuv-based event loop, faster than the default selector loop
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
@@ -1,29 +1,78 @@
 """Memory management using Qdrant vector database."""
 
+import asyncio
+import logging
 import os
+import time
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import UTC, datetime
+from operator import itemgetter
+from typing import Awaitable, Callable, Optional
 
-from qdrant_client import QdrantClient
+import numpy as np
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams, PointStruct
 
+logger = logging.getLogger(__name__)
 
 # Collection names
 CHAT_HISTORY_COLLECTION = "chat_history"
 USER_FACTS_COLLECTION = "user_facts"
+RESPONSE_CACHE_COLLECTION = "response_cache"
+
+# Payload indexes on chat history (timestamps are stored as ISO 8601)
+CHAT_HISTORY_INDEXES = {
+    "role": models.PayloadSchemaType.KEYWORD,
+    "timestamp": models.PayloadSchemaType.DATETIME,
+}
+
+# Payload fields read back from each collection; other fields stay on the server
+HISTORY_FIELDS = ["role", "content", "timestamp"]
+FACT_FIELDS = ["fact"]
+PAYLOAD_FIELDS = {
+    CHAT_HISTORY_COLLECTION: HISTORY_FIELDS,
+    USER_FACTS_COLLECTION: FACT_FIELDS,
+}
 
 # Vector dimensions for nomic-embed-text
 EMBEDDING_DIM = 768
 
+# Semantic response cache defaults
+RESPONSE_CACHE_THRESHOLD = 0.92
+RESPONSE_CACHE_CAPACITY = 1000
+
+# Writes are buffered and sent in one upsert once this many points are
+# pending, or after the flush interval (seconds), whichever comes first
+WRITE_BATCH_SIZE = 32
+WRITE_FLUSH_INTERVAL = 0.5
+
+# Seconds to wait before retrying a failed write
+WRITE_RETRY_INTERVAL = 5.0
+
+# Messages shorter than this ("ok", "lol", "yes") are not worth a
+# similarity search
+MIN_SEARCH_QUERY_LENGTH = 8
+MIN_SEARCH_QUERY_WORDS = 3
+
+# Qdrant servers (host, port) whose collections were set up in this process
+_initialized_servers: set[tuple[str, int]] = set()
+
+
+def is_searchable_query(text: str) -> bool:
+    """Return whether a message is long enough for a meaningful similarity search."""
+    return (
+        len(text) >= MIN_SEARCH_QUERY_LENGTH
+        and len(text.split()) >= MIN_SEARCH_QUERY_WORDS
+    )
+
 
 class MemoryManager:
     """Manages chat history and user facts in Qdrant."""
 
     def __init__(
         self,
-        embed_func: callable,
+        embed_func: Callable[[str], Awaitable[list[float]]],
         host: Optional[str] = None,
         port: Optional[int] = None,
     ):
@@ -31,7 +80,7 @@ class MemoryManager:
         Initialize the memory manager.
 
         Args:
-            embed_func: Function that takes text and returns embedding vector
+            embed_func: Coroutine function that takes text and returns embedding vector
             host: Qdrant host (defaults to QDRANT_HOST env var)
             port: Qdrant port (defaults to QDRANT_PORT env var)
         """
@@ -39,36 +88,78 @@ class MemoryManager:
         self.port = port or int(os.getenv("QDRANT_PORT", "6333"))
         self.embed = embed_func
 
-        self.client = QdrantClient(host=self.host, port=self.port)
-        self._ensure_collections()
-
-    def _ensure_collections(self) -> None:
-        """Create collections if they don't exist."""
-        collections = [c.name for c in self.client.get_collections().collections]
+        # gRPC sends points as protobuf instead of JSON, which is cheaper to
+        # encode and parse for long message payloads
+        self.client = AsyncQdrantClient(
+            host=self.host,
+            port=self.port,
+            grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+            prefer_grpc=os.getenv("QDRANT_PREFER_GRPC", "1") == "1",
+        )
 
-        if CHAT_HISTORY_COLLECTION not in collections:
-            self.client.create_collection(
-                collection_name=CHAT_HISTORY_COLLECTION,
-                vectors_config=VectorParams(
-                    size=EMBEDDING_DIM,
-                    distance=Distance.COSINE,
-                ),
+        # In-memory copy of all stored facts (insertion ordered) mapped to
+        # their "- " bullet lines, loaded on first use and kept up to date by
+        # add_fact, plus the joined bullet list built from it
+        self._facts_cache: Optional[dict[str, str]] = None
+        self._facts_text: Optional[str] = None
+        self._facts_lock = asyncio.Lock()
+
+        # Points waiting to be written, per collection; reads flush them first
+        # so they never miss a buffered write
+        self._pending: dict[str, list[PointStruct]] = {
+            CHAT_HISTORY_COLLECTION: [],
+            USER_FACTS_COLLECTION: [],
+        }
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> None:
+        """Create collections and payload indexes if they don't exist."""
+        # Each Qdrant server only needs to be set up once per process
+        server = (self.host, self.port)
+        if server in _initialized_servers:
+            return
+
+        collections = {
+            c.name for c in (await self.client.get_collections()).collections
+        }
+
+        # Create the missing collections concurrently
+        await asyncio.gather(
+            *(
+                self.client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=VectorParams(
+                        size=EMBEDDING_DIM,
+                        distance=Distance.COSINE,
+                    ),
+                )
+                for collection_name in (CHAT_HISTORY_COLLECTION, USER_FACTS_COLLECTION)
+                if collection_name not in collections
             )
+        )
 
-        if USER_FACTS_COLLECTION not in collections:
-            self.client.create_collection(
-                collection_name=USER_FACTS_COLLECTION,
-                vectors_config=VectorParams(
-                    size=EMBEDDING_DIM,
-                    distance=Distance.COSINE,
-                ),
+        # Index the fields chat history is filtered and ordered by, so those
+        # queries don't scan every message (no-op if the index exists)
+        await asyncio.gather(
+            *(
+                self.client.create_payload_index(
+                    collection_name=CHAT_HISTORY_COLLECTION,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                )
+                for field_name, field_schema in CHAT_HISTORY_INDEXES.items()
             )
+        )
+
+        _initialized_servers.add(server)
 
-    def add_message(
+    async def add_message(
         self,
         role: str,
         content: str,
         timestamp: Optional[datetime] = None,
+        embedding: Optional[list[float]] = None,
     ) -> str:
         """
         Add a message to chat history.
@@ -77,18 +168,20 @@ class MemoryManager:
             role: "user" or "assistant"
             content: Message content
             timestamp: Message timestamp (defaults to now)
+            embedding: Precomputed embedding of the content (embedded if None)
 
         Returns:
             Message ID
         """
-        msg_id = str(uuid.uuid4())
-        ts = timestamp or datetime.utcnow()
+        msg_id = _new_point_id()
+        ts = timestamp or datetime.now(UTC)
 
-        embedding = self.embed(content)
+        if embedding is None:
+            embedding = await self.embed(content)
 
-        self.client.upsert(
-            collection_name=CHAT_HISTORY_COLLECTION,
-            points=[
+        await self._queue_points(
+            CHAT_HISTORY_COLLECTION,
+            [
                 PointStruct(
                     id=msg_id,
                     vector=embedding,
@@ -103,7 +196,7 @@ class MemoryManager:
 
         return msg_id
 
-    def add_fact(self, fact: str, source_message_id: Optional[str] = None) -> str:
+    async def add_fact(self, fact: str, source_message_id: Optional[str] = None) -> str:
         """
         Add a fact about the user.
 
@@ -114,27 +207,112 @@ class MemoryManager:
         Returns:
             Fact ID
         """
-        fact_id = str(uuid.uuid4())
-        embedding = self.embed(fact)
+        fact_ids = await self.add_facts(
+            [fact], [await self.embed(fact)], source_message_id=source_message_id
+        )
+        return fact_ids[0]
 
-        self.client.upsert(
-            collection_name=USER_FACTS_COLLECTION,
-            points=[
+    async def add_facts(
+        self,
+        facts: list[str],
+        embeddings: list[list[float]],
+        source_message_id: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Add several facts about the user in a single write.
+
+        Args:
+            facts: The facts to store
+            embeddings: Embedding of each fact, in the same order
+            source_message_id: Optional ID of the message the facts were extracted from
+
+        Returns:
+            Fact IDs in the same order as the facts
+        """
+        fact_ids = [_new_point_id() for _ in facts]
+        created_at = datetime.now(UTC).isoformat()
+
+        await self._queue_points(
+            USER_FACTS_COLLECTION,
+            [
                 PointStruct(
                     id=fact_id,
                     vector=embedding,
                     payload={
                         "fact": fact,
                         "source_message_id": source_message_id,
-                        "created_at": datetime.utcnow().isoformat(),
+                        "created_at": created_at,
                     },
                 )
+                for fact_id, fact, embedding in zip(fact_ids, facts, embeddings)
             ],
         )
 
-        return fact_id
+        if self._facts_cache is not None:
+            for fact in facts:
+                self._facts_cache[fact] = f"- {fact}"
+            self._facts_text = None
+
+        return fact_ids
+
+    async def _queue_points(
+        self, collection_name: str, points: list[PointStruct]
+    ) -> None:
+        """Buffer points for a collection, flushing once the batch is full."""
+        pending = self._pending[collection_name]
+        pending.extend(points)
+        if len(pending) >= WRITE_BATCH_SIZE:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self, delay: float = WRITE_FLUSH_INTERVAL) -> None:
+        """Flush the buffered points once the delay (seconds) has passed."""
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered points to Qdrant, one upsert per collection."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        async with self._flush_lock:
+            batches = {name: points for name, points in self._pending.items() if points}
+            for name in batches:
+                self._pending[name] = []
+
+            for name, points in batches.items():
+                try:
+                    await self.client.upsert(collection_name=name, points=points)
+                except Exception as e:
+                    # Keep the points (ahead of newer ones) for the next flush
+                    self._pending[name][:0] = points
+                    logger.error(
+                        f"Failed to write {len(points)} points to {name}, "
+                        f"will retry: {e}"
+                    )
+
+            # Retry failed writes even if no later write or read flushes them
+            if any(self._pending.values()) and self._flush_task is None:
+                self._flush_task = asyncio.create_task(
+                    self._flush_later(WRITE_RETRY_INTERVAL)
+                )
 
-    def get_relevant_history(
+    async def close(self) -> None:
+        """Write any buffered points and close the Qdrant connection."""
+        await self.flush()
+        if self._flush_task is not None:
+            # Nothing retries after the connection is closed
+            self._flush_task.cancel()
+            self._flush_task = None
+        unwritten = sum(len(points) for points in self._pending.values())
+        if unwritten:
+            logger.error(f"Closing with {unwritten} points that could not be written")
+        await self.client.close()
+
+    async def get_relevant_history(
         self,
         query: str,
         limit: int = 10,
@@ -149,30 +327,36 @@ class MemoryManager:
         Returns:
             List of messages with role, content, and timestamp
         """
-        embedding = self.embed(query)
+        return await self.get_relevant_history_by_vector(
+            await self.embed(query), limit=limit
+        )
+
+    async def get_relevant_history_by_vector(
+        self,
+        embedding: list[float],
+        limit: int = 10,
+    ) -> list[dict]:
+        """
+        Get chat history relevant to an already embedded query.
 
-        results = self.client.search(
+        Args:
+            embedding: Embedding vector of the query
+            limit: Maximum number of messages to return
+
+        Returns:
+            List of messages with role, content, and timestamp
+        """
+        await self.flush()
+        results = await self.client.search(
             collection_name=CHAT_HISTORY_COLLECTION,
             query_vector=embedding,
             limit=limit,
+            with_payload=HISTORY_FIELDS,
+            with_vectors=False,
         )
+        return _history_from_points(results)
 
-        messages = []
-        for result in results:
-            messages.append(
-                {
-                    "role": result.payload["role"],
-                    "content": result.payload["content"],
-                    "timestamp": result.payload["timestamp"],
-                    "score": result.score,
-                }
-            )
-
-        # Sort by timestamp to maintain conversation order
-        messages.sort(key=lambda m: m["timestamp"])
-        return messages
-
-    def get_recent_history(self, limit: int = 20) -> list[dict]:
+    async def get_recent_history(self, limit: int = 20) -> list[dict]:
         """
         Get the most recent chat messages.
 
@@ -182,32 +366,22 @@ class MemoryManager:
         Returns:
             List of messages sorted by timestamp (oldest first)
         """
-        # Scroll through all messages and sort by timestamp
-        results, _ = self.client.scroll(
+        await self.flush()
+
+        # Let Qdrant pick the newest messages using the timestamp index
+        results, _ = await self.client.scroll(
             collection_name=CHAT_HISTORY_COLLECTION,
-            limit=limit * 2,  # Get more than needed to ensure we have enough
-            with_payload=True,
+            limit=limit,
+            order_by=models.OrderBy(key="timestamp", direction=models.Direction.DESC),
+            with_payload=HISTORY_FIELDS,
             with_vectors=False,
         )
 
-        messages = []
-        for point in results:
-            messages.append(
-                {
-                    "role": point.payload["role"],
-                    "content": point.payload["content"],
-                    "timestamp": point.payload["timestamp"],
-                }
-            )
-
-        # Sort by timestamp and take the most recent
-        messages.sort(key=lambda m: m["timestamp"], reverse=True)
-        messages = messages[:limit]
-        messages.reverse()  # Return in chronological order
-
-        return messages
+        # Payloads only hold HISTORY_FIELDS, so they are returned as the
+        # messages directly, in chronological order
+        return [point.payload for point in reversed(results)]
 
-    def get_relevant_facts(self, query: str, limit: int = 5) -> list[str]:
+    async def get_relevant_facts(self, query: str, limit: int = 5) -> list[str]:
         """
         Get facts about the user relevant to the query.
 
@@ -218,30 +392,142 @@ class MemoryManager:
         Returns:
             List of fact strings
         """
-        embedding = self.embed(query)
+        return await self.get_relevant_facts_by_vector(
+            await self.embed(query), limit=limit
+        )
+
+    async def get_relevant_facts_by_vector(
+        self, embedding: list[float], limit: int = 5
+    ) -> list[str]:
+        """
+        Get facts about the user relevant to an already embedded query.
 
-        results = self.client.search(
+        Args:
+            embedding: Embedding vector of the query
+            limit: Maximum number of facts to return
+
+        Returns:
+            List of fact strings
+        """
+        await self.flush()
+        results = await self.client.search(
             collection_name=USER_FACTS_COLLECTION,
             query_vector=embedding,
             limit=limit,
+            with_payload=FACT_FIELDS,
+            with_vectors=False,
         )
 
         return [result.payload["fact"] for result in results]
 
-    def get_all_facts(self) -> list[str]:
-        """Get all stored facts about the user."""
-        results, _ = self.client.scroll(
-            collection_name=USER_FACTS_COLLECTION,
-            limit=100,
-            with_payload=True,
-            with_vectors=False,
+    async def get_relevant_context_by_vector(
+        self,
+        embedding: list[float],
+        history_limit: int = 5,
+        facts_limit: int = 5,
+    ) -> tuple[list[dict], list[str]]:
+        """
+        Get relevant chat history and facts for an already embedded query.
+
+        Args:
+            embedding: Embedding vector of the query
+            history_limit: Maximum number of messages to return
+            facts_limit: Maximum number of facts to return
+
+        Returns:
+            Tuple of (messages sorted by timestamp, fact strings)
+        """
+        history_points, fact_points = await self.search_batch(
+            [
+                (CHAT_HISTORY_COLLECTION, embedding, history_limit),
+                (USER_FACTS_COLLECTION, embedding, facts_limit),
+            ]
+        )
+        return (
+            _history_from_points(history_points),
+            [point.payload["fact"] for point in fact_points],
         )
 
-        return [point.payload["fact"] for point in results]
+    async def search_batch(
+        self, queries: list[tuple[str, list[float], int]]
+    ) -> list[list[models.ScoredPoint]]:
+        """
+        Run several similarity searches with one batch request per collection.
+
+        Args:
+            queries: (collection name, query vector, limit) for each search
+
+        Returns:
+            Matching points for each query, in the same order as the queries
+        """
+        await self.flush()
+
+        # Group the queries so each collection gets a single request
+        by_collection: dict[str, list[int]] = {}
+        for i, (collection_name, _, _) in enumerate(queries):
+            by_collection.setdefault(collection_name, []).append(i)
+
+        responses = await asyncio.gather(
+            *(
+                self.client.query_batch_points(
+                    collection_name=collection_name,
+                    requests=[
+                        models.QueryRequest(
+                            query=queries[i][1],
+                            limit=queries[i][2],
+                            with_payload=PAYLOAD_FIELDS.get(collection_name, True),
+                            with_vector=False,
+                        )
+                        for i in indices
+                    ],
+                )
+                for collection_name, indices in by_collection.items()
+            )
+        )
+
+        results: list[list[models.ScoredPoint]] = [[] for _ in queries]
+        for indices, batch in zip(by_collection.values(), responses):
+            for i, response in zip(indices, batch):
+                results[i] = response.points
+        return results
+
+    async def get_all_facts(self) -> list[str]:
+        """Get all stored facts about the user."""
+        async with self._facts_lock:
+            return list(await self._load_facts())
+
+    async def get_facts_text(self) -> str:
+        """
+        Get all stored facts as a "- " bulleted list, one fact per line.
+
+        Returns:
+            Bulleted facts (empty string if none are stored)
+        """
+        async with self._facts_lock:
+            facts = await self._load_facts()
+            if self._facts_text is None:
+                self._facts_text = "\n".join(facts.values())
+            return self._facts_text
+
+    async def _load_facts(self) -> dict[str, str]:
+        """Return the facts cache, loading it on first use (lock must be held)."""
+        if self._facts_cache is None:
+            await self.flush()
+            results, _ = await self.client.scroll(
+                collection_name=USER_FACTS_COLLECTION,
+                limit=100,
+                with_payload=FACT_FIELDS,
+                with_vectors=False,
+            )
+            self._facts_cache = {
+                point.payload["fact"]: f"- {point.payload['fact']}" for point in results
+            }
+        return self._facts_cache
 
-    def get_last_user_message_time(self) -> Optional[datetime]:
+    async def get_last_user_message_time(self) -> Optional[datetime]:
         """Get the timestamp of the last user message."""
-        results, _ = self.client.scroll(
+        await self.flush()
+        results, _ = await self.client.scroll(
             collection_name=CHAT_HISTORY_COLLECTION,
             scroll_filter=models.Filter(
                 must=[
@@ -251,20 +537,172 @@ class MemoryManager:
                     )
                 ]
             ),
-            limit=100,
-            with_payload=True,
+            limit=1,
+            order_by=models.OrderBy(key="timestamp", direction=models.Direction.DESC),
+            with_payload=["timestamp"],
             with_vectors=False,
         )
 
         if not results:
             return None
 
-        # Find the most recent timestamp
-        timestamps = [datetime.fromisoformat(p.payload["timestamp"]) for p in results]
+        timestamp = datetime.fromisoformat(results[0].payload["timestamp"])
+        # Messages stored before timestamps carried an offset are naive UTC
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=UTC)
+        return timestamp
 
-        return max(timestamps) if timestamps else None
-
-    def message_count(self) -> int:
+    async def message_count(self) -> int:
         """Get the total number of messages in history."""
-        collection_info = self.client.get_collection(CHAT_HISTORY_COLLECTION)
+        await self.flush()
+        collection_info = await self.client.get_collection(CHAT_HISTORY_COLLECTION)
         return collection_info.points_count
+
+
+class SemanticCache:
+    """
+    Caches assistant responses keyed by the embedding of the user message.
+
+    Lookups run against an in-memory matrix of normalized embeddings; Qdrant
+    only persists the entries so the cache survives restarts.
+    """
+
+    def __init__(
+        self,
+        client: AsyncQdrantClient,
+        threshold: float = RESPONSE_CACHE_THRESHOLD,
+        capacity: int = RESPONSE_CACHE_CAPACITY,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            client: Qdrant client to store cached responses in
+            threshold: Minimum cosine similarity for a cache hit
+            capacity: Maximum number of cached responses
+        """
+        self.client = client
+        self.threshold = threshold
+        self.capacity = capacity
+
+        # Point IDs are reused round-robin so the cache never grows past
+        # capacity; set from the stored entries by _load_entries
+        self._next_slot = 0
+
+        # Row i holds the normalized embedding cached in slot i, so a dot
+        # product with a normalized query gives cosine similarities
+        self._vectors = np.zeros((self.capacity, EMBEDDING_DIM), dtype=np.float32)
+        self._responses: list[Optional[str]] = [None] * self.capacity
+
+    async def initialize(self) -> None:
+        """Create the cache collection if needed and load the stored entries."""
+        await self._ensure_collection()
+        await self._load_entries()
+
+    async def _ensure_collection(self) -> None:
+        """Create the cache collection if it doesn't exist."""
+        if not await self.client.collection_exists(RESPONSE_CACHE_COLLECTION):
+            await self.client.create_collection(
+                collection_name=RESPONSE_CACHE_COLLECTION,
+                vectors_config=VectorParams(
+                    size=EMBEDDING_DIM,
+                    distance=Distance.COSINE,
+                ),
+            )
+
+    async def _load_entries(self) -> None:
+        """Load persisted cache entries into the in-memory index."""
+        results, _ = await self.client.scroll(
+            collection_name=RESPONSE_CACHE_COLLECTION,
+            limit=self.capacity,
+            with_payload=["response", "created_at"],
+            with_vectors=True,
+        )
+
+        created_at = [""] * self.capacity
+        for point in results:
+            if isinstance(point.id, int) and point.id < self.capacity:
+                self._vectors[point.id] = _normalize(point.vector)
+                self._responses[point.id] = point.payload["response"]
+                created_at[point.id] = point.payload.get("created_at", "")
+
+        # Continue at the first free slot, or overwrite the oldest entry once
+        # the cache is full; empty timestamps sort first and cover both cases
+        self._next_slot = min(range(self.capacity), key=created_at.__getitem__)
+
+    def query(self, embedding: list[float]) -> Optional[str]:
+        """
+        Look up a cached response for a semantically similar message.
+
+        Args:
+            embedding: Embedding vector of the user message
+
+        Returns:
+            The cached response, or None if nothing is similar enough
+        """
+        scores = self._vectors @ _normalize(embedding)
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self._responses[best]
+
+    async def update(self, embedding: list[float], response: str) -> None:
+        """
+        Store a response for the given user message embedding.
+
+        Args:
+            embedding: Embedding vector of the user message
+            response: The generated response
+        """
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.capacity
+        self._vectors[slot] = _normalize(embedding)
+        self._responses[slot] = response
+
+        await self.client.upsert(
+            collection_name=RESPONSE_CACHE_COLLECTION,
+            points=[
+                PointStruct(
+                    id=slot,
+                    vector=embedding,
+                    payload={
+                        "response": response,
+                        "created_at": datetime.now(UTC).isoformat(),
+                    },
+                )
+            ],
+        )
+
+
+def _new_point_id() -> str:
+    """
+    Return a new time-ordered point ID (a version 7 UUID).
+
+    The first 48 bits are the Unix time in milliseconds, so IDs sort by
+    creation time and scrolling by ID walks points oldest first.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+def _history_from_points(points: list[models.ScoredPoint]) -> list[dict]:
+    """Convert chat history search results to messages sorted by timestamp."""
+    # Payloads only hold HISTORY_FIELDS, so each one already is the message
+    messages = []
+    for point in points:
+        message = point.payload
+        message["score"] = point.score
+        messages.append(message)
+
+    # Sort by timestamp to maintain conversation order
+    messages.sort(key=itemgetter("timestamp"))
+    return messages
+
+
+def _normalize(vector: list[float]) -> np.ndarray:
+    """Return the vector scaled to unit length."""
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    return array / norm if norm else array
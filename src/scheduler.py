@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -81,13 +81,13 @@ class ProactiveScheduler:
     async def _check_and_send_proactive(self) -> None:
         """Check if we should send a proactive message and send one if needed."""
         try:
-            last_user_message = self.bot.memory.get_last_user_message_time()
+            last_user_message = await self.bot.memory.get_last_user_message_time()
 
             if last_user_message is None:
                 logger.debug("No messages in history, skipping proactive check")
                 return
 
-            now = datetime.utcnow()
+            now = datetime.now(UTC)
             time_since_last = now - last_user_message
             threshold = timedelta(hours=INACTIVITY_THRESHOLD_HOURS)
 
@@ -118,8 +118,10 @@ class ProactiveScheduler:
         """Generate and send a proactive message."""
         try:
             # Get context for generating the message
-            recent_messages = self.bot.memory.get_recent_history(limit=10)
-            user_facts = self.bot.memory.get_all_facts()
+            recent_messages, user_facts_text = await asyncio.gather(
+                self.bot.memory.get_recent_history(limit=10),
+                self.bot.memory.get_facts_text(),
+            )
 
             # Get the proactive prompt from character config
             proactive_prompt = self.bot.character.get_proactive_prompt("check_in")
@@ -131,18 +133,19 @@ class ProactiveScheduler:
                 )
 
             # Generate the message
-            message = self.bot.llm.generate_proactive_message(
+            message = await self.bot.llm.generate_proactive_message(
                 system_prompt=self.bot.character.get_system_prompt(),
+                context=self.bot.character.get_context_prompt(),
                 proactive_prompt=proactive_prompt,
                 recent_messages=recent_messages,
-                user_facts=user_facts,
+                user_facts_text=user_facts_text,
             )
 
             # Send it
             success = await self.bot.send_proactive_message(message)
 
             if success:
-                self._last_proactive_message = datetime.utcnow()
+                self._last_proactive_message = datetime.now(UTC)
                 logger.info("Proactive message sent successfully")
 
         except Exception as e:
@@ -0,0 +1,45 @@
+"""Services shared by all bots in the process."""
+
+import os
+from dataclasses import dataclass
+
+from .embedder import BatchEmbedder
+from .llm import LLMClient
+from .memory import MemoryManager, SemanticCache
+
+
+@dataclass(slots=True)
+class Services:
+    """LLM, memory and embedding services used by every bot."""
+
+    llm: LLMClient
+    memory: MemoryManager
+    embedder: BatchEmbedder
+
+
+async def create_services() -> Services:
+    """Create the shared services from environment variables."""
+    from .tools import create_default_registry
+
+    # Create tool registry with default tools (calendar, reminders)
+    tool_registry = create_default_registry()
+
+    # Create LLM client with tools
+    llm = LLMClient(tool_registry=tool_registry)
+
+    # Batch embedding requests that arrive within a short window
+    embedder = BatchEmbedder(llm.embed_batch)
+
+    # Create memory manager with embedding function
+    memory = MemoryManager(embed_func=embedder.embed)
+    await memory.initialize()
+
+    # Optionally answer repeated questions from a semantic response cache
+    cache_threshold = os.getenv("SEMANTIC_CACHE_THRESHOLD")
+    if cache_threshold:
+        llm.response_cache = SemanticCache(
+            memory.client, threshold=float(cache_threshold)
+        )
+        await llm.response_cache.initialize()
+
+    return Services(llm=llm, memory=memory, embedder=embedder)
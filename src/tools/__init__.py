@@ -24,9 +24,13 @@ __all__ = [
 def create_default_registry() -> ToolRegistry:
     """Create a registry with all default tools."""
     registry = ToolRegistry()
-    registry.register(CalendarTool())
-    registry.register(RemindersTool())
-    registry.register(CreateReminderTool())
-    registry.register(EditReminderTool())
-    registry.register(CompleteReminderTool())
+    registry.register_all(
+        [
+            CalendarTool(),
+            RemindersTool(),
+            CreateReminderTool(),
+            EditReminderTool(),
+            CompleteReminderTool(),
+        ]
+    )
     return registry
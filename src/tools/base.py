@@ -58,14 +58,23 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        # Ollama schemas of all tools, built on first use
+        self._ollama_tools: list[dict] | None = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         if tool.name in self._tools:
             logger.warning(f"Tool '{tool.name}' already registered, overwriting")
         self._tools[tool.name] = tool
+        self._ollama_tools = None
         logger.info(f"Registered tool: {tool.name}")
 
+    def register_all(self, tools: list[Tool]) -> None:
+        """Register several tools and build their Ollama schemas once."""
+        for tool in tools:
+            self.register(tool)
+        self._ollama_tools = [tool.to_ollama_tool() for tool in self._tools.values()]
+
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
         return self._tools.get(name)
@@ -75,8 +84,12 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def get_ollama_tools(self) -> list[dict]:
-        """Get all tools in Ollama format."""
-        return [tool.to_ollama_tool() for tool in self._tools.values()]
+        """Get all tools in Ollama format (cached until a tool is registered)."""
+        if self._ollama_tools is None:
+            self._ollama_tools = [
+                tool.to_ollama_tool() for tool in self._tools.values()
+            ]
+        return self._ollama_tools
 
     def __len__(self) -> int:
         return len(self._tools)
@@ -109,10 +122,14 @@ class ToolExecutor:
             logger.error(error_msg)
             return f"Error: {error_msg}"
 
+        # Skip formatting arguments and results when INFO logs are dropped
+        log_info = logger.isEnabledFor(logging.INFO)
         try:
-            logger.info(f"Executing tool '{tool_name}' with args: {arguments}")
+            if log_info:
+                logger.info(f"Executing tool '{tool_name}' with args: {arguments}")
             result = tool.execute(**arguments)
-            logger.info(f"Tool '{tool_name}' returned: {result[:200]}...")
+            if log_info:
+                logger.info(f"Tool '{tool_name}' returned: {result[:200]}...")
             return result
         except Exception as e:
             error_msg = f"Tool '{tool_name}' failed: {e}"
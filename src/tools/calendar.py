@@ -2,7 +2,9 @@
 
 import logging
 import sys
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
+from operator import itemgetter
 from typing import Any
 
 from .base import Tool
@@ -28,12 +30,17 @@ if IS_MACOS:
 else:
     EVENTKIT_AVAILABLE = False
 
+# How long the list of calendars is reused before asking EventKit again
+CALENDARS_CACHE_TTL = 60.0
+
 
 class CalendarTool(Tool):
     """Tool for reading calendar events from the system calendar."""
 
     def __init__(self):
         self._store = None
+        self._calendars = None
+        self._calendars_fetched_at = 0.0
         if EVENTKIT_AVAILABLE:
             self._init_event_store()
 
@@ -148,18 +155,21 @@ class CalendarTool(Tool):
             return "Calendar access has not been granted. Please allow calendar access in System Preferences."
 
         try:
-            # Parse dates
+            # Parse dates (fromisoformat is much faster than strptime); date
+            # rather than datetime so a time in the input can't shift the range
             if start_date:
-                start = datetime.strptime(start_date, "%Y-%m-%d")
+                start = datetime.combine(
+                    date.fromisoformat(start_date), datetime.min.time()
+                )
             else:
                 start = datetime.now().replace(
                     hour=0, minute=0, second=0, microsecond=0
                 )
 
             if end_date:
-                end = datetime.strptime(end_date, "%Y-%m-%d").replace(
-                    hour=23, minute=59, second=59
-                )
+                end = datetime.combine(
+                    date.fromisoformat(end_date), datetime.min.time()
+                ).replace(hour=23, minute=59, second=59)
             else:
                 end = start + timedelta(days=7)
 
@@ -169,29 +179,34 @@ class CalendarTool(Tool):
             )
             end_ns = Foundation.NSDate.dateWithTimeIntervalSince1970_(end.timestamp())
 
-            # Get all calendars
-            calendars = self._store.calendarsForEntityType_(EventKit.EKEntityTypeEvent)
-
             # Create predicate for the date range
             predicate = self._store.predicateForEventsWithStartDate_endDate_calendars_(
-                start_ns, end_ns, calendars
+                start_ns, end_ns, self._get_calendars()
             )
 
             # Fetch events
             events = self._store.eventsMatchingPredicate_(predicate)
 
             if not events or len(events) == 0:
-                return f"No calendar events found between {start.strftime('%Y-%m-%d')} and {end.strftime('%Y-%m-%d')}."
-
-            # Format events
-            event_list = []
-            for event in sorted(
-                events, key=lambda e: e.startDate().timeIntervalSince1970()
-            ):
-                event_info = self._format_event(event)
-                event_list.append(event_info)
+                return f"No calendar events found between {start.date().isoformat()} and {end.date().isoformat()}."
+
+            # Read each event's fields once (every access crosses the
+            # Objective-C bridge), then sort and format the plain tuples
+            rows = [
+                (
+                    event.startDate().timeIntervalSince1970(),
+                    event.endDate().timeIntervalSince1970(),
+                    event.title(),
+                    event.location(),
+                    event.notes(),
+                    event.isAllDay(),
+                )
+                for event in events
+            ]
+            rows.sort(key=itemgetter(0))
+            event_list = [self._format_event(row) for row in rows]
 
-            header = f"Calendar events from {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}:\n"
+            header = f"Calendar events from {start.date().isoformat()} to {end.date().isoformat()}:\n"
             return header + "\n".join(event_list)
 
         except ValueError as e:
@@ -200,33 +215,49 @@ class CalendarTool(Tool):
             logger.error(f"Error fetching calendar events: {e}", exc_info=True)
             return f"Error fetching calendar events: {e}"
 
-    def _format_event(self, event) -> str:
-        """Format a single event for display."""
-        title = event.title() or "Untitled"
+    def _get_calendars(self):
+        """Get all event calendars, reusing the list for CALENDARS_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if (
+            self._calendars is None
+            or now - self._calendars_fetched_at > CALENDARS_CACHE_TTL
+        ):
+            self._calendars = self._store.calendarsForEntityType_(
+                EventKit.EKEntityTypeEvent
+            )
+            self._calendars_fetched_at = now
+        return self._calendars
+
+    def _format_event(self, row: tuple) -> str:
+        """
+        Format a single event for display.
+
+        Args:
+            row: (start timestamp, end timestamp, title, location, notes, all day)
+        """
+        start_ts, end_ts, title, location, notes, is_all_day = row
+        title = title or "Untitled"
 
         # Format start/end times
-        start_ts = event.startDate().timeIntervalSince1970()
-        end_ts = event.endDate().timeIntervalSince1970()
         start_dt = datetime.fromtimestamp(start_ts)
         end_dt = datetime.fromtimestamp(end_ts)
 
-        if event.isAllDay():
-            time_str = f"{start_dt.strftime('%Y-%m-%d')} (all day)"
+        # isoformat renders these fixed formats without going through strftime
+        if is_all_day:
+            time_str = f"{start_dt.date().isoformat()} (all day)"
         else:
             if start_dt.date() == end_dt.date():
-                time_str = f"{start_dt.strftime('%Y-%m-%d %H:%M')} - {end_dt.strftime('%H:%M')}"
+                time_str = f"{start_dt.isoformat(' ', 'minutes')} - {end_dt.time().isoformat('minutes')}"
             else:
-                time_str = f"{start_dt.strftime('%Y-%m-%d %H:%M')} - {end_dt.strftime('%Y-%m-%d %H:%M')}"
+                time_str = f"{start_dt.isoformat(' ', 'minutes')} - {end_dt.isoformat(' ', 'minutes')}"
 
         parts = [f"- {title}: {time_str}"]
 
         # Add location if present
-        location = event.location()
         if location:
             parts.append(f"  Location: {location}")
 
         # Add notes if present (truncated)
-        notes = event.notes()
         if notes:
             truncated = notes[:100] + "..." if len(notes) > 100 else notes
             parts.append(f"  Notes: {truncated}")
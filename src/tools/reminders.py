@@ -1,8 +1,13 @@
 """Reminders tool using macOS EventKit."""
 
 import logging
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from operator import itemgetter
 from typing import Any, Optional
 
 from .base import Tool
@@ -28,69 +33,72 @@ if IS_MACOS:
 else:
     EVENTKIT_AVAILABLE = False
 
+# Value of date components that are not set
+DATE_COMPONENT_UNDEFINED = (
+    Foundation.NSDateComponentUndefined if EVENTKIT_AVAILABLE else sys.maxsize
+)
 
-class RemindersTool(Tool):
-    """Tool for reading reminders from the system Reminders app."""
+# Longest time the reminder lists are reused before asking EventKit again
+CALENDARS_CACHE_TTL = 60.0
 
-    def __init__(self):
-        self._store = None
-        if EVENTKIT_AVAILABLE:
-            self._init_event_store()
+# Seconds to wait for the user to answer the reminders access prompt
+ACCESS_TIMEOUT = 30.0
 
-    def _init_event_store(self) -> None:
-        """Initialize the EventKit event store."""
-        try:
-            self._store = EventKit.EKEventStore.alloc().init()
-            # Request access (this will prompt user on first run)
-            self._request_access()
-        except Exception as e:
-            logger.error(f"Failed to initialize EventKit store: {e}")
-            self._store = None
+# Seconds to wait for EventKit to deliver fetched reminders
+FETCH_TIMEOUT = 10.0
 
-    def _request_access(self) -> bool:
-        """Request reminders access from the user."""
-        if not self._store:
-            return False
+# Display names of EventKit priority values
+PRIORITY_NAMES = {1: "High", 5: "Medium", 9: "Low"}
 
-        # For macOS 14+, use the new API
-        try:
-            # Try the newer API first (macOS 14+)
-            granted = [False]
-            error = [None]
+# EventKit priority values of the priority names tools accept
+PRIORITY_VALUES = {"high": 1, "medium": 5, "low": 9, "none": 0}
 
-            def completion_handler(access_granted, err):
-                granted[0] = access_granted
-                error[0] = err
+# Checkbox shown for incomplete and completed reminders
+CHECKBOXES = ("[ ]", "[x]")
 
-            self._store.requestFullAccessToRemindersWithCompletion_(completion_handler)
+# Reminder fields read for display. Only direct keys are used: a key path
+# like "dueDateComponents.year" would ask the NSNull that stands in for a
+# missing due date for its year, which raises.
+REMINDER_KEYS = (
+    "dueDateComponents",
+    "title",
+    "completed",
+    "priority",
+    "notes",
+    "calendar",
+)
 
-            if error[0]:
-                logger.error(f"Reminders access error: {error[0]}")
-                return False
+# Due date components read for display, in sort order
+DUE_DATE_KEYS = ("year", "month", "day", "hour", "minute")
 
-            return granted[0]
-        except AttributeError:
-            # Fall back to older API
-            try:
-                granted = [False]
-                error = [None]
+# Event store shared by all reminder tools, created on first use
+_shared_store = None
+_store_lock = threading.Lock()
 
-                def completion_handler(access_granted, err):
-                    granted[0] = access_granted
-                    error[0] = err
 
-                self._store.requestAccessToEntityType_completion_(
-                    EventKit.EKEntityTypeReminder, completion_handler
-                )
+@dataclass(slots=True)
+class _ReminderLists:
+    """Reminder lists of the shared store, as cached by _get_reminder_lists."""
 
-                if error[0]:
-                    logger.error(f"Reminders access error: {error[0]}")
-                    return False
+    fetched_at: float
+    calendars: list
+    # Display titles, one per case-insensitive name
+    titles: list[str]
+    # Lower-cased title -> calendars with that title
+    by_title: dict[str, list]
 
-                return granted[0]
-            except Exception as e:
-                logger.error(f"Failed to request reminders access: {e}")
-                return False
+
+# Cached reminder lists of the shared store
+_reminder_lists: Optional[_ReminderLists] = None
+
+
+class RemindersTool(Tool):
+    """Tool for reading reminders from the system Reminders app."""
+
+    def __init__(self):
+        # The shared store is looked up on first use, so registering the
+        # tool never blocks on EventKit or prompts for access
+        self._store = None
 
     @property
     def name(self) -> str:
@@ -143,174 +151,306 @@ class RemindersTool(Tool):
                 "This feature requires macOS with pyobjc-framework-EventKit installed."
             )
 
+        self._store = _get_event_store()
         if not self._store:
             return "Reminders access has not been granted. Please allow reminders access in System Preferences."
 
         try:
             # Get calendars (reminder lists)
-            calendars = self._store.calendarsForEntityType_(
-                EventKit.EKEntityTypeReminder
-            )
+            lists = _get_reminder_lists(self._store)
+            calendars = lists.calendars
 
             if list_name:
                 # Filter to specific list
-                calendars = [c for c in calendars if c.title() == list_name]
+                calendars = lists.by_title.get(list_name.lower())
                 if not calendars:
-                    available_lists = [
-                        c.title()
-                        for c in self._store.calendarsForEntityType_(
-                            EventKit.EKEntityTypeReminder
-                        )
-                    ]
                     return (
                         f"Reminder list '{list_name}' not found. "
-                        f"Available lists: {', '.join(available_lists)}"
+                        f"Available lists: {', '.join(lists.titles)}"
                     )
 
-            # Create predicate for reminders
-            predicate = self._store.predicateForRemindersInCalendars_(calendars)
+            # Create predicate for reminders; EventKit filters out completed
+            # reminders itself unless they were asked for
+            if include_completed:
+                predicate = self._store.predicateForRemindersInCalendars_(calendars)
+            else:
+                predicate = self._store.predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(
+                    None, None, calendars
+                )
 
             # Fetch reminders (synchronous fetch)
-            reminders = self._fetch_reminders_sync(predicate)
+            reminders = _fetch_reminders(self._store, predicate)
 
             if not reminders:
+                kind = "reminders" if include_completed else "incomplete reminders"
                 if list_name:
-                    return f"No reminders found in list '{list_name}'."
-                return "No reminders found."
-
-            # Filter by completion status
-            if not include_completed:
-                reminders = [r for r in reminders if not r.isCompleted()]
-
-            if not reminders:
-                return "No incomplete reminders found."
+                    return f"No {kind} found in list '{list_name}'."
+                return f"No {kind} found."
+
+            # Read each field for all reminders at once through key-value
+            # coding: one bridge crossing per field instead of one per
+            # reminder and field
+            columns = [_column(reminders, key) for key in REMINDER_KEYS]
+            # Reminders share a few lists, so read each list's title once
+            list_titles = {}
+            rows = []
+            for due, title, completed, priority, notes, calendar in zip(*columns):
+                if calendar is not None and calendar not in list_titles:
+                    list_titles[calendar] = calendar.title()
+                rows.append(
+                    (
+                        self._decode_due(due),
+                        title,
+                        completed,
+                        priority,
+                        notes,
+                        list_titles.get(calendar),
+                    )
+                )
 
             # Sort by due date (items without due date last)
-            def sort_key(r):
-                due = r.dueDateComponents()
-                if due:
-                    # Create a date from components
-                    year = due.year() if due.year() != 9223372036854775807 else 9999
-                    month = due.month() if due.month() != 9223372036854775807 else 12
-                    day = due.day() if due.day() != 9223372036854775807 else 31
-                    return (0, year, month, day)
-                return (1, 9999, 12, 31)
-
-            reminders = sorted(reminders, key=sort_key)
-
-            # Format reminders
-            reminder_list = []
-            for reminder in reminders:
-                reminder_info = self._format_reminder(reminder)
-                reminder_list.append(reminder_info)
+            rows.sort(key=itemgetter(0))
 
             header = "Reminders"
             if list_name:
                 header += f" from '{list_name}'"
-            header += ":\n"
+            header += ":"
+
+            # Format reminders into one list of lines joined once
+            lines = [header]
+            for row in rows:
+                lines.extend(self._format_reminder(row))
 
-            return header + "\n".join(reminder_list)
+            return "\n".join(lines)
 
         except Exception as e:
             logger.error(f"Error fetching reminders: {e}", exc_info=True)
             return f"Error fetching reminders: {e}"
 
-    def _fetch_reminders_sync(self, predicate) -> list:
-        """Fetch reminders synchronously."""
-        import threading
+    def _decode_due(self, due) -> tuple:
+        """
+        Build the due date sort key from a reminder's due date components.
 
-        reminders = []
-        done = threading.Event()
+        Args:
+            due: The reminder's NSDateComponents, or None
 
-        def completion(result):
-            nonlocal reminders
-            if result:
-                reminders = list(result)
-            done.set()
+        Returns:
+            (0, year, month, day, hour, minute) if the reminder has a due
+            date, (1,) otherwise. Unset components keep the very large
+            DATE_COMPONENT_UNDEFINED value, so they sort after any real one.
+        """
+        if due is None:
+            return (1,)
+        # One bridge crossing for all components
+        values = due.dictionaryWithValuesForKeys_(DUE_DATE_KEYS)
+        return (0, *(values[key] for key in DUE_DATE_KEYS))
 
-        self._store.fetchRemindersMatchingPredicate_completion_(predicate, completion)
+    def _format_reminder(self, row: tuple) -> list[str]:
+        """
+        Format a single reminder for display.
 
-        # Wait for completion (with timeout)
-        done.wait(timeout=10.0)
-        return reminders
+        Args:
+            row: (due date key, title, completed, priority, notes, list title)
 
-    def _format_reminder(self, reminder) -> str:
-        """Format a single reminder for display."""
-        title = reminder.title() or "Untitled"
+        Returns:
+            The reminder's output lines
+        """
+        due, title, completed, priority, notes, list_title = row
+        title = title or "Untitled"
 
-        parts = [f"- {'[x]' if reminder.isCompleted() else '[ ]'} {title}"]
+        parts = [f"- {CHECKBOXES[bool(completed)]} {title}"]
 
         # Add due date if present
-        due_components = reminder.dueDateComponents()
-        if due_components:
-            year = due_components.year()
-            month = due_components.month()
-            day = due_components.day()
-
-            # Check for valid components (large numbers indicate "not set")
-            if year < 9000 and month < 13 and day < 32:
+        if due[0] == 0:
+            _, year, month, day, hour, minute = due
+
+            # Check for valid components
+            if DATE_COMPONENT_UNDEFINED not in (year, month, day):
                 due_str = f"{year:04d}-{month:02d}-{day:02d}"
 
                 # Check for time
-                hour = due_components.hour()
-                minute = due_components.minute()
-                if hour < 24 and minute < 60:
+                if DATE_COMPONENT_UNDEFINED not in (hour, minute):
                     due_str += f" {hour:02d}:{minute:02d}"
 
                 parts.append(f"  Due: {due_str}")
 
         # Add priority if set
-        priority = reminder.priority()
         if priority > 0:
-            priority_map = {1: "High", 5: "Medium", 9: "Low"}
-            priority_str = priority_map.get(priority, f"Priority {priority}")
+            priority_str = PRIORITY_NAMES.get(priority) or f"Priority {priority}"
             parts.append(f"  Priority: {priority_str}")
 
         # Add notes if present (truncated)
-        notes = reminder.notes()
         if notes:
             truncated = notes[:100] + "..." if len(notes) > 100 else notes
             parts.append(f"  Notes: {truncated}")
 
         # Add list name
-        calendar = reminder.calendar()
-        if calendar:
-            parts.append(f"  List: {calendar.title()}")
+        if list_title:
+            parts.append(f"  List: {list_title}")
 
-        return "\n".join(parts)
+        return parts
 
 
 # Shared helper functions for reminder tools
 
 
+def _has_reminders_access() -> bool:
+    """Check whether this process may already read and write reminders."""
+    status = EventKit.EKEventStore.authorizationStatusForEntityType_(
+        EventKit.EKEntityTypeReminder
+    )
+    # EKAuthorizationStatusFullAccess (macOS 14+) has the same value as the
+    # older EKAuthorizationStatusAuthorized
+    return status == EventKit.EKAuthorizationStatusAuthorized
+
+
 def _get_event_store():
-    """Get or create a shared EventKit event store."""
+    """
+    Get the EventKit event store shared by all reminder tools.
+
+    The store is only kept once access has been granted; otherwise None is
+    returned and the next call asks again.
+    """
+    global _shared_store
     if not EVENTKIT_AVAILABLE:
         return None
+    # Other tool threads wait here while the user answers the access prompt.
+    # That's intended: they can't do anything without access either, and
+    # asking from several threads at once would show the prompt repeatedly.
+    with _store_lock:
+        if _shared_store is None:
+            try:
+                store = EventKit.EKEventStore.alloc().init()
+                # Request access (this will prompt user on first run)
+                if not _request_access(store):
+                    return None
+                # Drop the cached reminder lists when they change
+                Foundation.NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+                    EventKit.EKEventStoreChangedNotification,
+                    store,
+                    None,
+                    _clear_reminder_lists,
+                )
+                _shared_store = store
+            except Exception as e:
+                logger.error(f"Failed to get event store: {e}")
+        return _shared_store
+
+
+def _request_access(store) -> bool:
+    """Request reminders access from the user and wait for the answer."""
+    # Skip the request when access was already granted in an earlier run
+    if _has_reminders_access():
+        return True
+
+    granted = [False]
+    error = [None]
+    done = threading.Event()
+
+    def completion_handler(access_granted, err):
+        granted[0] = access_granted
+        error[0] = err
+        done.set()
+
     try:
-        store = EventKit.EKEventStore.alloc().init()
-        # Request access
         try:
-            store.requestFullAccessToRemindersWithCompletion_(lambda granted, err: None)
+            # Try the newer API first (macOS 14+)
+            store.requestFullAccessToRemindersWithCompletion_(completion_handler)
         except AttributeError:
+            # Fall back to older API
             store.requestAccessToEntityType_completion_(
-                EventKit.EKEntityTypeReminder, lambda granted, err: None
+                EventKit.EKEntityTypeReminder, completion_handler
             )
-        return store
     except Exception as e:
-        logger.error(f"Failed to get event store: {e}")
-        return None
+        logger.error(f"Failed to request reminders access: {e}")
+        return False
+
+    # The handler runs once the user has answered the prompt
+    if not done.wait(timeout=ACCESS_TIMEOUT):
+        logger.warning(
+            f"No answer to the reminders access request after {ACCESS_TIMEOUT}s"
+        )
+        return False
+
+    if error[0]:
+        logger.error(f"Reminders access error: {error[0]}")
+        return False
+
+    return granted[0]
+
+
+def _fetch_reminders(store, predicate) -> list:
+    """
+    Fetch the reminders matching a predicate and wait for the result.
+
+    The reminders are returned as the NSArray EventKit delivers, so callers
+    can read fields for all of them with key-value coding.
+
+    EventKit calls the completion handler on one of its own queues, which
+    hands the result over through a SimpleQueue.
+    """
+    results = queue.SimpleQueue()
+
+    def completion(result):
+        results.put(result or [])
+
+    store.fetchRemindersMatchingPredicate_completion_(predicate, completion)
+
+    # Wait for completion (with timeout)
+    try:
+        return results.get(timeout=FETCH_TIMEOUT)
+    except queue.Empty:
+        logger.warning(f"Fetching reminders timed out after {FETCH_TIMEOUT}s")
+        return []
+
+
+def _column(reminders, key: str) -> list:
+    """Read one field of every reminder, with None for missing values."""
+    if not reminders:
+        return []
+    return [
+        None if isinstance(value, Foundation.NSNull) else value
+        for value in reminders.valueForKey_(key)
+    ]
+
+
+def _get_reminder_lists(store) -> _ReminderLists:
+    """
+    Get all reminder lists and an index of them by title.
+
+    Both are reused until EventKit reports a change to the store, or for at
+    most CALENDARS_CACHE_TTL seconds.
+    """
+    global _reminder_lists
+    now = time.monotonic()
+    lists = _reminder_lists
+    if lists is None or now - lists.fetched_at > CALENDARS_CACHE_TTL:
+        calendars = list(store.calendarsForEntityType_(EventKit.EKEntityTypeReminder))
+        titles = []
+        by_title = {}
+        for calendar in calendars:
+            title = calendar.title()
+            # Titles aren't unique across accounts, so each maps to a list
+            matches = by_title.setdefault(title.lower(), [])
+            if not matches:
+                titles.append(title)
+            matches.append(calendar)
+        lists = _ReminderLists(now, calendars, titles, by_title)
+        _reminder_lists = lists
+    return lists
+
+
+def _clear_reminder_lists(notification) -> None:
+    """Forget the cached reminder lists after the event store changed."""
+    global _reminder_lists
+    _reminder_lists = None
 
 
 def _get_calendar_by_name(store, list_name: Optional[str]):
     """Get a calendar/reminder list by name, or return the default."""
-    calendars = store.calendarsForEntityType_(EventKit.EKEntityTypeReminder)
-
     if list_name:
-        for cal in calendars:
-            if cal.title() == list_name:
-                return cal
-        return None
+        calendars = _get_reminder_lists(store).by_title.get(list_name.lower())
+        return calendars[0] if calendars else None
 
     # Return default calendar for reminders
     return store.defaultCalendarForNewReminders()
@@ -321,68 +461,88 @@ def _parse_due_date(date_str: str):
     if not EVENTKIT_AVAILABLE:
         return None
 
+    # fromisoformat is much faster than strptime
     try:
         # Try parsing with time first
         if " " in date_str and ":" in date_str:
-            dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M")
-            components = Foundation.NSDateComponents.alloc().init()
-            components.setYear_(dt.year)
-            components.setMonth_(dt.month)
-            components.setDay_(dt.day)
-            components.setHour_(dt.hour)
-            components.setMinute_(dt.minute)
-            return components
+            dt = datetime.fromisoformat(date_str)
+            fields = {
+                "year": dt.year,
+                "month": dt.month,
+                "day": dt.day,
+                "hour": dt.hour,
+                "minute": dt.minute,
+            }
         else:
             # Parse date only
-            dt = datetime.strptime(date_str.split()[0], "%Y-%m-%d")
-            components = Foundation.NSDateComponents.alloc().init()
-            components.setYear_(dt.year)
-            components.setMonth_(dt.month)
-            components.setDay_(dt.day)
-            return components
+            dt = date.fromisoformat(date_str.split()[0])
+            fields = {"year": dt.year, "month": dt.month, "day": dt.day}
     except ValueError as e:
         logger.error(f"Failed to parse date '{date_str}': {e}")
         return None
 
-
-def _find_reminder_by_title(store, title: str, list_name: Optional[str] = None):
-    """Find a reminder by its title."""
-    import threading
-
-    calendars = store.calendarsForEntityType_(EventKit.EKEntityTypeReminder)
+    # Set all fields in one call instead of one setter call per field
+    components = Foundation.NSDateComponents.alloc().init()
+    components.setValuesForKeysWithDictionary_(fields)
+    return components
+
+
+def _find_reminder_by_title(
+    store,
+    title: str,
+    list_name: Optional[str] = None,
+    completed: Optional[bool] = None,
+):
+    """
+    Find a reminder by its title.
+
+    Args:
+        store: EventKit event store
+        title: Title of the reminder (case-insensitive)
+        list_name: Name of the list to search in (None for all lists)
+        completed: Only search completed (True) or incomplete (False)
+            reminders; None searches all of them
+    """
+    lists = _get_reminder_lists(store)
+    calendars = lists.calendars
 
     if list_name:
-        calendars = [c for c in calendars if c.title() == list_name]
+        calendars = lists.by_title.get(list_name.lower())
         if not calendars:
-            return None, f"List '{list_name}' not found"
-
-    predicate = store.predicateForRemindersInCalendars_(calendars)
-
-    reminders = []
-    done = threading.Event()
-
-    def completion(result):
-        nonlocal reminders
-        if result:
-            reminders = list(result)
-        done.set()
+            return (
+                None,
+                f"List '{list_name}' not found. "
+                f"Available lists: {', '.join(lists.titles)}",
+            )
 
-    store.fetchRemindersMatchingPredicate_completion_(predicate, completion)
-    done.wait(timeout=10.0)
+    # Let EventKit filter by completion status when asked to
+    if completed is None:
+        predicate = store.predicateForRemindersInCalendars_(calendars)
+    elif completed:
+        predicate = store.predicateForCompletedRemindersWithCompletionDateStarting_ending_calendars_(
+            None, None, calendars
+        )
+    else:
+        predicate = (
+            store.predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(
+                None, None, calendars
+            )
+        )
+    reminders = _fetch_reminders(store, predicate)
 
-    # Find reminder with matching title (case-insensitive)
+    # Find reminder with matching title (case-insensitive), reading all
+    # titles in one key-value coding call
     title_lower = title.lower()
-    for reminder in reminders:
-        if reminder.title() and reminder.title().lower() == title_lower:
-            return reminder, None
+    for index, reminder_title in enumerate(_column(reminders, "title")):
+        if reminder_title and reminder_title.lower() == title_lower:
+            return reminders[index], None
 
     return None, f"Reminder '{title}' not found"
 
 
 def _priority_str_to_int(priority: str) -> int:
     """Convert priority string to EventKit priority value."""
-    priority_map = {"high": 1, "medium": 5, "low": 9, "none": 0}
-    return priority_map.get(priority.lower(), 0)
+    return PRIORITY_VALUES.get(priority.lower(), 0) if priority else 0
 
 
 class CreateReminderTool(Tool):
@@ -390,8 +550,6 @@ class CreateReminderTool(Tool):
 
     def __init__(self):
         self._store = None
-        if EVENTKIT_AVAILABLE:
-            self._store = _get_event_store()
 
     @property
     def name(self) -> str:
@@ -455,6 +613,7 @@ class CreateReminderTool(Tool):
                 "This feature requires macOS with pyobjc-framework-EventKit installed."
             )
 
+        self._store = _get_event_store()
         if not self._store:
             return "Reminders access has not been granted. Please allow reminders access in System Preferences."
 
@@ -462,12 +621,7 @@ class CreateReminderTool(Tool):
             # Get the target calendar/list
             calendar = _get_calendar_by_name(self._store, list_name)
             if list_name and not calendar:
-                available_lists = [
-                    c.title()
-                    for c in self._store.calendarsForEntityType_(
-                        EventKit.EKEntityTypeReminder
-                    )
-                ]
+                available_lists = _get_reminder_lists(self._store).titles
                 return (
                     f"Reminder list '{list_name}' not found. "
                     f"Available lists: {', '.join(available_lists)}"
@@ -527,8 +681,6 @@ class EditReminderTool(Tool):
 
     def __init__(self):
         self._store = None
-        if EVENTKIT_AVAILABLE:
-            self._store = _get_event_store()
 
     @property
     def name(self) -> str:
@@ -599,6 +751,7 @@ class EditReminderTool(Tool):
                 "This feature requires macOS with pyobjc-framework-EventKit installed."
             )
 
+        self._store = _get_event_store()
         if not self._store:
             return "Reminders access has not been granted. Please allow reminders access in System Preferences."
 
@@ -669,8 +822,6 @@ class CompleteReminderTool(Tool):
 
     def __init__(self):
         self._store = None
-        if EVENTKIT_AVAILABLE:
-            self._store = _get_event_store()
 
     @property
     def name(self) -> str:
@@ -723,14 +874,22 @@ class CompleteReminderTool(Tool):
                 "This feature requires macOS with pyobjc-framework-EventKit installed."
             )
 
+        self._store = _get_event_store()
         if not self._store:
             return "Reminders access has not been granted. Please allow reminders access in System Preferences."
 
         try:
-            # Find the reminder
-            reminder, error = _find_reminder_by_title(self._store, title, list_name)
+            # Find the reminder among those that still need the change; this
+            # also keeps a same-titled reminder in the other state from
+            # hiding it
+            reminder, error = _find_reminder_by_title(
+                self._store, title, list_name, completed=not completed
+            )
             if error:
-                return error
+                # Fall back to all reminders to report an unchanged status
+                reminder, error = _find_reminder_by_title(self._store, title, list_name)
+                if error:
+                    return error
 
             # Check current status
             current_status = reminder.isCompleted()